@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# Obtained from https://github.com/agurwicz/scripts.
+
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from pathlib import Path
+
+scripts_path = Path(__file__).parent.parent.joinpath('src')
+
+# Interpreters of the synthetic versions, each answering the metadata probe of `BaseScript` without running Python.
+python_versions = {
+    'Python39': '3.9.19',
+    'Python311': '3.11.9',
+    'Python312': '3.12.4',
+    'Python313': '3.13.0'
+}
+packages_per_environment = 20
+opened_file_name = 'benchmark-file.txt'
+
+
+def parse_arguments():
+
+    argument_parser = ArgumentParser(
+        description='Measures the cold and warm wall time of scripts over synthetic environment roots, offline.',
+        formatter_class=ArgumentDefaultsHelpFormatter
+    )
+
+    argument_parser.add_argument(
+        '-n', '--sizes',
+        help='numbers of synthetic environments to measure with',
+        default=[10, 100, 1000],
+        nargs='+',
+        type=int
+    )
+
+    argument_parser.add_argument(
+        '-r', '--runs',
+        help='number of runs per script, size and cache state, the median is reported',
+        default=5,
+        type=int
+    )
+
+    argument_parser.add_argument(
+        '-o', '--output',
+        help='JSON file to write the results to',
+        default='latency.json',
+        type=os.path.abspath
+    )
+
+    argument_parser.add_argument(
+        '-c', '--compare',
+        help='JSON file of previous results e.g. from another commit, to print the change against',
+        type=os.path.abspath
+    )
+
+    argument_parser.add_argument(
+        '-w', '--work-directory',
+        help='directory for the synthetic roots, kept after running (default: a temporary directory)',
+        type=os.path.abspath
+    )
+
+    argument_parser.add_argument(
+        'scripts',
+        help='names of the scripts to measure (default: all of {})'.format(', '.join(get_benchmarks())),
+        nargs='*'
+    )
+
+    return argument_parser.parse_args()
+
+
+def get_benchmarks():
+
+    # Script names with their parameters, and whether they are expected to fail e.g. on validation.
+    return {
+        'listenvs': ([sys.executable, 'listenvs.py'], False),
+        'listpythonversions': ([sys.executable, 'listpythonversions.py'], False),
+        'listscripts': ([sys.executable, 'listscripts.py'], False),
+        'activateenv': (['bash', '-c', 'source activateenv.sh \"$0\" > /dev/null', 'env0000'], False),
+        'openfile': ([sys.executable, 'openfile.py', opened_file_name], False),
+        'createenv': ([sys.executable, 'createenv.py', 'benchmark-environment', '3.0'], True)
+    }
+
+
+def create_stub(stub_path, content):
+
+    with open(stub_path, mode='w') as stub_file:
+        stub_file.write('#!/bin/sh\n{}\n'.format(content))
+
+    os.chmod(stub_path, 0o755)
+
+
+def create_versions_root(root_path):
+
+    for version_name, version in python_versions.items():
+
+        binaries_path = root_path.joinpath(version_name, 'bin')
+        os.makedirs(binaries_path)
+
+        create_stub(
+            stub_path=binaries_path.joinpath('python3'),
+            content='echo \'{}\''.format(json.dumps({
+                'version': version,
+                'implementation': 'CPython',
+                'abi': 'cpython-{}-x86_64-linux-gnu'.format(''.join(version.split('.')[:2])),
+                'platform': 'linux-x86_64'
+            }))
+        )
+
+
+def create_environments_root(root_path, versions_root_path, size):
+
+    version_names = list(python_versions)
+
+    for index in range(size):
+
+        version_name = version_names[index % len(version_names)]
+        version = python_versions[version_name]
+        environment_path = root_path.joinpath('env{:04d}'.format(index))
+        binaries_path = environment_path.joinpath('bin')
+        site_packages_path = environment_path.joinpath(
+            'lib', 'python{}.{}'.format(*version.split('.')[:2]), 'site-packages'
+        )
+
+        os.makedirs(binaries_path)
+        os.symlink(versions_root_path.joinpath(version_name, 'bin', 'python3'), binaries_path.joinpath('python'))
+        binaries_path.joinpath('activate').write_text('# Synthetic environment, activating does nothing.\n')
+
+        environment_path.joinpath('pyvenv.cfg').write_text(
+            'home = {}\ninclude-system-site-packages = false\nversion = {}\n'.format(
+                versions_root_path.joinpath(version_name, 'bin'),
+                version
+            )
+        )
+
+        for package_index in range(packages_per_environment):
+
+            package_name = 'package{}'.format(package_index)
+            distribution_path = site_packages_path.joinpath('{}-1.{}.dist-info'.format(package_name, index))
+
+            os.makedirs(distribution_path)
+            os.makedirs(site_packages_path.joinpath(package_name))
+            site_packages_path.joinpath(package_name, '__init__.py').write_text('')
+            distribution_path.joinpath('METADATA').write_text(
+                'Metadata-Version: 2.1\nName: {}\nVersion: 1.{}\n'.format(package_name, index)
+            )
+            distribution_path.joinpath('RECORD').write_text('{}/__init__.py,,\n'.format(package_name))
+
+
+def measure(parameters, environment, expect_failure):
+
+    start_time = time.perf_counter()
+    result = subprocess.run(
+        args=parameters,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        cwd=scripts_path,
+        env=environment
+    )
+    wall_time = time.perf_counter() - start_time
+
+    if (result.returncode != 0) != expect_failure:
+        raise Exception('Command \"{}\" exited with code {}: {}'.format(
+            ' '.join(parameters),
+            result.returncode,
+            result.stderr.strip()
+        ))
+
+    return wall_time * 1000
+
+
+def get_commit():
+
+    try:
+        return subprocess.run(
+            args=['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            text=True,
+            cwd=scripts_path
+        ).stdout.strip() or None
+
+    except OSError:
+        return None
+
+
+def main():
+
+    arguments = parse_arguments()
+
+    if os.name == 'nt':
+        raise Exception('Synthetic interpreters are shell scripts, run the benchmarks on macOS or Linux.')
+
+    benchmarks = get_benchmarks()
+    for script_name in arguments.scripts:
+        if script_name not in benchmarks:
+            raise Exception('No benchmark for \"{}\". Options are: {}'.format(script_name, list(benchmarks)))
+
+    if shutil.which('bash') is None:
+        benchmarks.pop('activateenv')
+        print('Skipping \"activateenv\", bash was not found.', file=sys.stderr)
+
+    script_names = [
+        script_name
+        for script_name in arguments.scripts or benchmarks
+        if script_name in benchmarks
+    ]
+
+    work_path = Path(arguments.work_directory or tempfile.mkdtemp(prefix='scripts-benchmarks-'))
+    os.makedirs(work_path, exist_ok=True)
+
+    # Scripts are pointed at the synthetic roots with the variables' environment overrides.
+    environment = {
+        name: value
+        for name, value in os.environ.items()
+        if not name.startswith('SCRIPTS_')
+    }
+
+    # `openfile` finds its file in `$PATH` and opens it with `open`, replaced by one that does nothing.
+    binaries_path = work_path.joinpath('bin')
+    shutil.rmtree(binaries_path, ignore_errors=True)
+    os.makedirs(binaries_path)
+    create_stub(stub_path=binaries_path.joinpath('open'), content='exit 0')
+    binaries_path.joinpath(opened_file_name).write_text('')
+    environment['PATH'] = os.pathsep.join([str(binaries_path), environment.get('PATH', '')])
+
+    versions_root_path = work_path.joinpath('versions')
+    shutil.rmtree(versions_root_path, ignore_errors=True)
+    create_versions_root(root_path=versions_root_path)
+    environment['SCRIPTS_PYTHON_VERSIONS_PATH'] = str(versions_root_path)
+
+    baseline = load_baseline(baseline_path=arguments.compare)
+    results = []
+
+    try:
+        for size in arguments.sizes:
+
+            environments_root_path = work_path.joinpath('environments{}'.format(size))
+            shutil.rmtree(environments_root_path, ignore_errors=True)
+            create_environments_root(
+                root_path=environments_root_path,
+                versions_root_path=versions_root_path,
+                size=size
+            )
+
+            cache_path = work_path.joinpath('cache{}'.format(size))
+            environment['SCRIPTS_PYTHON_ENVIRONMENTS_PATH'] = str(environments_root_path)
+            environment['SCRIPTS_CACHE_PATH'] = str(cache_path)
+
+            for script_name in script_names:
+
+                parameters, expect_failure = benchmarks[script_name]
+
+                # Cold runs start without any cache, warm runs with the caches left by the run before.
+                cold_times = []
+                for _ in range(arguments.runs):
+                    shutil.rmtree(cache_path, ignore_errors=True)
+                    cold_times.append(
+                        measure(parameters=parameters, environment=environment, expect_failure=expect_failure)
+                    )
+
+                warm_times = [
+                    measure(parameters=parameters, environment=environment, expect_failure=expect_failure)
+                    for _ in range(arguments.runs)
+                ]
+
+                for cache_state, times in (('cold', cold_times), ('warm', warm_times)):
+                    results.append({
+                        'script': script_name,
+                        'environments': size,
+                        'cache': cache_state,
+                        'median_ms': round(statistics.median(times), 3),
+                        'min_ms': round(min(times), 3),
+                        'times_ms': [round(wall_time, 3) for wall_time in times]
+                    })
+
+                print_results(results=results[-2:], baseline=baseline)
+
+    finally:
+        if arguments.work_directory is None:
+            shutil.rmtree(work_path, ignore_errors=True)
+
+    with open(arguments.output, mode='w') as output_file:
+        json.dump(
+            {
+                'commit': get_commit(),
+                'python': sys.version.split()[0],
+                'platform': sys.platform,
+                'runs': arguments.runs,
+                'results': results
+            },
+            output_file,
+            indent=2
+        )
+
+    print('Results written to \"{}\".'.format(arguments.output))
+
+
+def load_baseline(baseline_path):
+
+    if baseline_path is None:
+        return {}
+
+    with open(baseline_path, mode='r') as baseline_file:
+        baseline = json.load(baseline_file)
+
+    return {
+        (result['script'], result['environments'], result['cache']): result['median_ms']
+        for result in baseline['results']
+    }
+
+
+def print_results(results, baseline):
+
+    for result in results:
+
+        baseline_time = baseline.get((result['script'], result['environments'], result['cache']))
+
+        print(
+            '{script:<20} {environments:>5} envs  {cache:<4} {median:9.2f} ms{change}'.format(
+                script=result['script'],
+                environments=result['environments'],
+                cache=result['cache'],
+                median=result['median_ms'],
+                change=' ({:+.1f}%)'.format((result['median_ms'] / baseline_time - 1) * 100)
+                if baseline_time else ''
+            ),
+            flush=True
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# Obtained from https://github.com/agurwicz/scripts.
+
+import os
+import statistics
+import subprocess
+import sys
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from pathlib import Path
+
+scripts_path = Path(__file__).parent.parent.joinpath('src')
+
+# Modules that belong to specific code paths and must not be paid for just to start a script.
+forbidden_modules = ['subprocess', 'platform', 'concurrent.futures', 'threading', 'xml.etree.ElementTree']
+
+# Script run through the entry point `scripts.py` to measure it, one importing `BaseScript` like all others.
+entry_point_script_name = 'listenvs'
+
+
+def parse_arguments():
+
+    argument_parser = ArgumentParser(
+        description='Checks the cold start import time of every script against a budget, using `-X importtime`.',
+        formatter_class=ArgumentDefaultsHelpFormatter
+    )
+
+    argument_parser.add_argument(
+        '-b', '--budget',
+        help='maximum import time in milliseconds of each script, on top of the bare interpreter',
+        default=60.0,
+        type=float
+    )
+
+    argument_parser.add_argument(
+        '-r', '--runs',
+        help='number of runs per script, the median is compared with the budget',
+        default=5,
+        type=int
+    )
+
+    argument_parser.add_argument(
+        'scripts',
+        help='names of the scripts to check (default: all scripts)',
+        nargs='*'
+    )
+
+    return argument_parser.parse_args()
+
+
+def measure_imports(parameters):
+
+    # Bytecode must be written, otherwise compilation is measured instead of imports.
+    environment = dict(os.environ)
+    environment.pop('PYTHONDONTWRITEBYTECODE', None)
+
+    result = subprocess.run(
+        args=[sys.executable, '-X', 'importtime'] + parameters,
+        capture_output=True,
+        text=True,
+        cwd=scripts_path,
+        env=environment
+    )
+
+    import_time = 0
+    imported_modules = set()
+
+    # Lines look like "import time:  self [us] |  cumulative |   package", nesting is given by the indentation.
+    for line in result.stderr.splitlines():
+
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative_time, module_name = line.split('|')
+        imported_modules.add(module_name.strip())
+
+        if len(module_name) - len(module_name.lstrip()) == 1:
+            import_time += int(cumulative_time)
+
+    return import_time / 1000, imported_modules
+
+
+def main():
+
+    arguments = parse_arguments()
+
+    script_names = arguments.scripts or sorted(
+        script_path.stem
+        for script_path in scripts_path.glob('*.py')
+        if not script_path.name.startswith('_')
+    )
+
+    baseline_time = statistics.median(
+        measure_imports(parameters=['-c', 'pass'])[0]
+        for _ in range(arguments.runs)
+    )
+
+    failed = False
+    for script_name in script_names:
+
+        # The entry point imports a script only when running one, so it's measured running a script through it.
+        parameters = ['{}.py'.format(script_name), '--help']
+        if script_name == 'scripts':
+            parameters = ['scripts.py', entry_point_script_name, '--help']
+
+        # The first run only writes the bytecode of the script's modules.
+        measurements = [
+            measure_imports(parameters=parameters)
+            for _ in range(arguments.runs + 1)
+        ][1:]
+
+        import_time = statistics.median(measurement[0] for measurement in measurements) - baseline_time
+        loaded_forbidden_modules = sorted(
+            set(forbidden_modules).intersection(*[measurement[1] for measurement in measurements])
+        )
+
+        script_failed = import_time > arguments.budget or len(loaded_forbidden_modules) > 0
+        failed = failed or script_failed
+
+        print(
+            '{status} {script_name:<20} {import_time:7.2f} ms{forbidden}'.format(
+                status='\033[91mFAIL\033[0m' if script_failed else '\033[92mPASS\033[0m',
+                script_name=script_name,
+                import_time=import_time,
+                forbidden=' (imports {})'.format(', '.join(loaded_forbidden_modules))
+                if loaded_forbidden_modules else ''
+            )
+        )
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -40,6 +40,8 @@ class ActivateEnv(BaseScript):
 
     def run(self):
 
+        self.record_environment_usage(environment_name=self._arguments.environment_name)
+
         activate_path = os.path.join(
             self._variables.python_environments_path,
             self._arguments.environment_name,
@@ -65,6 +67,9 @@ class ActivateEnv(BaseScript):
                 # Solving by printing to stdout, to be captured by an `eval` call from a bash script.
                 print('source {}'.format(activate_path), file=sys.stdout)
 
+                # Reaching here from `activateenv.sh` means its cache missed, so the next activation won't.
+                self.update_environment_caches()
+
             else:
                 # Solving by setting `rcfile` to the activation script, but this spawns a new shell.
                 # Exit with `exit` instead of usual `deactivate`.
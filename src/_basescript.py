@@ -1,29 +1,89 @@
 # Obtained from https://github.com/agurwicz/scripts.
 
-import platform
-import subprocess
+# Modules used by only some code paths are imported where needed, keeping script startup cheap.
+import os
 import sys
+import time
+from _thread import allocate_lock, get_ident
 from abc import ABC, abstractmethod
 from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser, Namespace
 from pathlib import Path
-from shutil import which
-from xml.etree import ElementTree
+
+_import_time = time.time()  # Scripts import this module first, the time until running them is their startup.
+
+# Scripts built into a zipapp by `tools/buildzipapp.py` are inside the archive, which can't hold variables or the
+# cache, so both are next to the archive instead.
+archive_path = Path(__file__).parent if Path(__file__).parent.is_file() else None
+scripts_path = archive_path.parent if archive_path is not None else Path(__file__).parent
+
+# Hidden like the directories that aren't environments, so it never has an environment's name.
+usage_start_file_name = '.start'
 
 
 class BaseScript(ABC):
 
-    def __init__(self):
+    __variables = None
+    __python_metadata_cache = None
+    __python_metadata_cache_lock = allocate_lock()  # Same as `threading.Lock`, without importing `threading`.
+    __profile_path = None
+    __profile_pending = False
+    __profile_events = []
+    __profile_depth = 0
+    __startup_time = _import_time
+
+    def __init__(self, arguments=None):
 
         self.__filter_exceptions()
+        self.__script_name = Path(sys.modules[type(self).__module__].__file__).stem
         self._argument_parser = ArgumentParser(
+            prog=Path(sys.modules[type(self).__module__].__file__).with_suffix('.py').name,
             description=self._description, 
             formatter_class=ArgumentDefaultsHelpFormatter
         )
+        self._argument_parser.add_argument(
+            '--profile',
+            help='write a Chrome trace of this run, including the scripts it runs, to a JSON file',
+            metavar='TRACE_PATH',
+            type=os.path.abspath
+        )
         
-        self._variables = self.__get_and_check_variables(variables_to_check=self._variables_to_check)
-        self._arguments = self.parse_arguments()
+        # Arguments are read from `sys.argv` unless the script is dispatched from another script.
+        self.__arguments_to_parse = arguments
+
+        # Scripts dispatched in-process are profiled as part of the outermost one, which writes the trace.
+        is_outermost = BaseScript.__profile_depth == 0
+        BaseScript.__profile_depth += 1
+
+        # Events are kept until the arguments tell whether to profile, as parsing them may already run scripts.
+        if is_outermost:
+            BaseScript.__profile_pending = True
+            BaseScript.__profile_events = []
+
+        try:
+            variables_time = time.time()
+            self._variables = self.__get_and_check_variables(variables_to_check=self._variables_to_check)
+            arguments_time = time.time()
+            self._arguments = self.parse_arguments()
+            run_time = time.time()
+
+            if is_outermost:
+                self.__start_profile(profile_path=self._arguments.profile or os.environ.get('SCRIPTS_PROFILE'))
+                self.__record_event(name='startup', start_time=BaseScript.__startup_time, end_time=variables_time)
+
+            self.__record_event(name='variables', start_time=variables_time, end_time=arguments_time)
+            self.__record_event(name='arguments', start_time=arguments_time, end_time=run_time)
 
-        self.run()
+            try:
+                self.run()
+            finally:
+                self.__record_event(name='run', start_time=run_time)
+
+        finally:
+            BaseScript.__profile_depth -= 1
+            if is_outermost:
+                BaseScript.__profile_pending = False
+                if BaseScript.__profile_path is not None:
+                    self.__write_profile()
 
     @property
     @abstractmethod
@@ -37,7 +97,7 @@ class BaseScript(ABC):
 
     @abstractmethod
     def parse_arguments(self):
-        return self._argument_parser.parse_args()
+        return self._argument_parser.parse_args(args=self.__arguments_to_parse)
 
     @abstractmethod
     def run(self):
@@ -45,52 +105,251 @@ class BaseScript(ABC):
     
     @property
     def _is_windows(self):
-        return 'windows' in platform.system().lower()
+        return os.name == 'nt'
+
+    @property
+    def _default_max_workers(self):
+        return min(32, (os.cpu_count() or 1) + 4)  # Same as `ThreadPoolExecutor`, for work waiting mostly on I/O.
+
+    @property
+    def _cache_path(self):
+        return Path(os.environ.get('SCRIPTS_CACHE_PATH', scripts_path.joinpath('.cache')))
 
     @staticmethod
     def open_command(command, parameters=()):
+        import subprocess
 
         if not isinstance(parameters, (list, tuple)):
             parameters = [parameters]
 
         subprocess.Popen(args=[command]+list(parameters))
 
-    def run_command(self, command, parameters=(), show_output=False):
+    def run_command(self, command, parameters=(), show_output=False, check=False):
+        import subprocess
         
         if not isinstance(parameters, (list, tuple)):
             parameters = [parameters]
 
+        start_time = time.time()
         result = subprocess.run(
             args=[command]+list(parameters),
-            capture_output=not show_output, 
+            capture_output=not show_output,
             text=True,
             shell=True if self._is_windows else False
         )
+        self.__record_command_event(
+            command=command,
+            parameters=parameters,
+            start_time=start_time,
+            return_code=result.returncode
+        )
+
+        if check and result.returncode != 0:
+            raise Exception('Command \"{}\" failed with exit code {}.'.format(command, result.returncode))
         
         if not show_output:
             return result.stdout.strip()
         return None
     
-    def run_script(self, script_name, parameters=(), show_output=False):
+    def run_commands(self, commands, max_workers=None, timeout=None, callback=None):
+        import asyncio
+
+        # Each command is a dictionary with "command" and "parameters", and optionally "output_prefix" to show
+        # its output with a prefix on each line, "output_path" to append it to a file, and its own "timeout".
+        # Output of commands with neither is returned. Failures are returned in place of output, as exceptions.
+        # `callback` is called with the index and result of each command as it finishes.
+        return asyncio.run(
+            self.__run_commands(
+                commands=commands,
+                max_workers=max_workers or self._default_max_workers,
+                timeout=timeout,
+                callback=callback
+            )
+        )
+
+    def get_script_command(self, script_name, parameters=()):
 
         if not isinstance(parameters, (list, tuple)):
             parameters = [parameters]
 
-        return self.run_command(
-            command=sys.executable,
-            parameters=[Path(__file__).parent.joinpath(script_name).with_suffix(suffix='.py')] + list(parameters),
-            show_output=show_output
-        )
+        # Scripts in a zipapp are run through its entry point, `scripts.py`.
+        if archive_path is not None:
+            script_parameters = [str(archive_path), script_name]
+        else:
+            script_parameters = [str(Path(__file__).parent.joinpath(script_name).with_suffix(suffix='.py'))]
 
-    def get_python_version(self, python_path):
-        
-        return self.run_command(
-            command=python_path, 
-            parameters=('-c', 'import platform; print(platform.python_version())')
+        return {
+            'command': sys.executable,
+            'parameters': script_parameters + [str(parameter) for parameter in parameters]
+        }
+
+    def run_script(self, script_name, parameters=(), show_output=False, isolated=False):
+
+        if not isinstance(parameters, (list, tuple)):
+            parameters = [parameters]
+
+        start_time = time.time()
+
+        try:
+            if isolated:
+                script_command = self.get_script_command(script_name=script_name, parameters=parameters)
+                return self.run_command(
+                    command=script_command['command'],
+                    parameters=script_command['parameters'],
+                    show_output=show_output
+                )
+
+            # Running in this interpreter, which shares the loaded variables and caches with the script.
+            script_class = self.__get_script_class(script_name=script_name)
+            arguments = [str(parameter) for parameter in parameters]
+
+            if show_output:
+                script_class(arguments=arguments)
+                return None
+
+            from contextlib import redirect_stdout
+            from io import StringIO
+
+            output = StringIO()
+            with redirect_stdout(output):
+                script_class(arguments=arguments)
+
+            return output.getvalue().strip()
+
+        finally:
+            parameters = [str(parameter) for parameter in parameters]
+            self.__record_event(
+                name='run_script {}'.format(' '.join([script_name] + parameters)),
+                start_time=start_time,
+                category='script',
+                arguments={'script': script_name, 'parameters': parameters}
+            )
+
+    def spawn_script(self, script_name, parameters=()):
+        import subprocess
+
+        script_command = self.get_script_command(script_name=script_name, parameters=parameters)
+
+        # Detaching from the terminal, so the script keeps running after the calling one exits.
+        subprocess.Popen(
+            args=[script_command['command']] + script_command['parameters'],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            # Detached scripts may outlive this one, so they aren't part of its profile.
+            env={name: value for name, value in os.environ.items() if not name.startswith('SCRIPTS_PROFILE')},
+            start_new_session=not self._is_windows,
+            creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP 
+            if self._is_windows else 0
         )
-    
+
+    def reload_variables(self):
+
+        # Dropping everything loaded by this process, so long-running scripts see changes made by others.
+        BaseScript.__variables = None
+        BaseScript.__python_metadata_cache = None
+
+        self._variables = self.__get_and_check_variables(variables_to_check=self._variables_to_check)
+
+    @staticmethod
+    def reset_profile():
+
+        # Forgetting the scripts running in this process e.g. in a forked child, so the next one is profiled as the
+        # outermost script, starting now.
+        BaseScript.__profile_path = None
+        BaseScript.__profile_pending = False
+        BaseScript.__profile_events = []
+        BaseScript.__profile_depth = 0
+        BaseScript.__startup_time = time.time()
+
+    @staticmethod
+    def map_concurrently(function, items, max_workers=None):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def __call(item):
+            try:
+                return function(item)
+
+            # Isolating failures, an item's exception is returned in place of its result.
+            except Exception as exception:
+                return exception
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # `map` yields results in the order of `items`, regardless of completion order.
+            return list(executor.map(__call, items))
+
+    def get_python_version(self, python_path, refresh=False):
+
+        python_metadata = self.get_python_metadata(python_path=python_path, refresh=refresh)
+
+        return python_metadata['version'] if python_metadata is not None else ''
+
+    def get_python_metadata(self, python_path, refresh=False):
+
+        # Raises `FileNotFoundError` for missing interpreters, same as running them would.
+        python_stat = os.stat(python_path)
+
+        # Any change to the binary changes at least one of these, invalidating its entry.
+        python_key = str(Path(python_path).absolute())
+        python_identity = [python_stat.st_ino, python_stat.st_mtime_ns, python_stat.st_size]
+
+        with BaseScript.__python_metadata_cache_lock:
+            cached_entry = self.__load_python_metadata_cache().get(python_key)
+
+        if not refresh and cached_entry is not None and cached_entry['identity'] == python_identity:
+            return cached_entry['metadata']
+
+        python_metadata = self.__probe_python_metadata(python_path=python_path)
+
+        if python_metadata is not None:
+            with BaseScript.__python_metadata_cache_lock:
+                self.__load_python_metadata_cache()[python_key] = {
+                    'identity': python_identity, 
+                    'metadata': python_metadata
+                }
+                self.__save_python_metadata_cache()
+
+        return python_metadata
+
+    def get_site_packages_path(self, environment_path):
+
+        if self._is_windows:
+            site_packages_path = Path(environment_path).joinpath('Lib', 'site-packages')
+            return site_packages_path if site_packages_path.is_dir() else None
+
+        try:
+            library_paths = [
+                library_path.path
+                for library_path in os.scandir(Path(environment_path).joinpath('lib'))
+                if library_path.name.startswith('python')
+            ]
+        except OSError:
+            return None
+
+        for library_path in library_paths:
+            site_packages_path = Path(library_path).joinpath('site-packages')
+            if site_packages_path.is_dir():
+                return site_packages_path
+
+        return None
+
+    def get_environment_python_version(self, environment_path, refresh=False):
+
+        # Reading the environment's metadata is much cheaper than launching its interpreter.
+        version = self.__read_environment_python_version(environment_path=Path(environment_path)) \
+            if not refresh else None
+
+        if version is None:
+            version = self.get_python_version(
+                python_path=Path(environment_path).joinpath(self._variables.python_relative_path),
+                refresh=refresh
+            )
+
+        return version
+
     @staticmethod
     def get_script_in_path(script_name):
+        from shutil import which
 
         script_name = Path(script_name)
 
@@ -171,6 +430,145 @@ class BaseScript(ABC):
         
         return environment_name
     
+    def record_environment_usage(self, environment_name):
+
+        # The modification time of an empty file for each environment is its last use, read by `gcenvs`.
+        usage_path = self._cache_path.joinpath('usage', environment_name)
+
+        try:
+            os.utime(usage_path)
+
+        except FileNotFoundError:
+            try:
+                self.__make_usage_directory()
+                open(usage_path, mode='w').close()
+            except OSError:
+                pass
+
+        except OSError:
+            pass
+
+    def __make_usage_directory(self):
+
+        # The marker's modification time is when recording started, environments unused since then count from it.
+        usage_path = self._cache_path.joinpath('usage')
+        os.makedirs(usage_path, exist_ok=True)
+
+        try:
+            open(usage_path.joinpath(usage_start_file_name), mode='x').close()
+        except FileExistsError:
+            pass
+
+    def update_inventory(self, refresh=False):
+        from _inventory import inventory_file_name, open_inventory, update_inventory
+
+        environments_path = self._variables.python_environments_path
+
+        connection = open_inventory(database_path=str(self._cache_path.joinpath(inventory_file_name)))
+        try:
+            update_inventory(
+                connection=connection,
+                site_packages_paths={
+                    environment.name: self.get_site_packages_path(environment_path=environment.path)
+                    for environment in os.scandir(environments_path)
+                    if environment.is_dir() and not environment.name.startswith('.')
+                },
+                refresh=refresh
+            )
+
+        finally:
+            connection.close()
+
+    def update_environment_caches(self):
+
+        # Activating from bash resolves environments through this file, without starting Python.
+        if not self._is_windows:
+
+            def __quote(value):
+                return '\'{}\''.format(str(value).replace('\'', '\'\\\'\''))
+
+            environments_path = self._variables.python_environments_path
+            activation_cases = [
+                '        {name}) _activateenv_path={path} ;;'.format(
+                    name=__quote(value=environment.name),
+                    path=__quote(value=os.path.join(environment.path, self._variables.activate_relative_path))
+                )
+                for environment in sorted(os.scandir(environments_path), key=lambda environment: environment.name)
+                if environment.is_dir() 
+                and not environment.name.startswith('.')
+                and os.path.isfile(os.path.join(environment.path, self._variables.activate_relative_path))
+            ]
+
+            self.__write_cache_file(
+                file_name='activate.sh',
+                content='\n'.join(
+                    [
+                        '# Generated by _basescript.py, sourced by activateenv.sh.',
+                        '_activateenv_root={}'.format(__quote(value=environments_path)),
+                        '_activateenv_lookup() {',
+                        '    case "$1" in'
+                    ] 
+                    + activation_cases 
+                    + [
+                        '        *) _activateenv_path= ;;',
+                        '    esac',
+                        '}',
+                        ''
+                    ]
+                )
+            )
+
+            # Activating from the cache records usage by truncating a file in this directory, which must exist.
+            try:
+                self.__make_usage_directory()
+            except OSError:
+                pass
+
+            # Completing from the shell reads names from this file, listing the directories changed since then.
+            from _registry import scripts
+
+            versions_path = getattr(self._variables, 'python_versions_path', '')
+            version_names = []
+            for version_name in sorted(os.listdir(versions_path) if os.path.isdir(versions_path) else []):
+                version_names.append(version_name)
+
+                # Versions are also given as e.g. "3.12" for "Python312".
+                version_digits = version_name[len('Python'):]
+                if version_name.startswith('Python') and version_digits.isdigit():
+                    version_names.append('{}.{}'.format(version_digits[0], version_digits[1:]))
+
+            names = {
+                'environments': sorted(
+                    environment.name
+                    for environment in os.scandir(environments_path)
+                    if environment.is_dir() and not environment.name.startswith('.')
+                ),
+                'versions': version_names,
+                'names': sorted(
+                    list(scripts) + [
+                        script_path.stem
+                        for script_path in scripts_path.glob('*.sh')
+                        if not script_path.name.startswith('_')
+                    ]
+                )
+            }
+
+            self.__write_cache_file(
+                file_name='completion.sh',
+                content='\n'.join(
+                    [
+                        '# Generated by _basescript.py, sourced by _completion.sh.',
+                        '_scripts_environments_path={}'.format(__quote(value=environments_path)),
+                        '_scripts_versions_path={}'.format(__quote(value=versions_path))
+                    ]
+                    + [
+                        '_scripts_{}=({})'.format(key, ' '.join(__quote(value=value) for value in values))
+                        for key, values in names.items()
+                    ]
+                    + ['']
+                )
+            )
+
     def __existing_environment(self, environment_name):
         
         def __check_file(relative_path):
@@ -183,6 +581,300 @@ class BaseScript(ABC):
             __check_file(relative_path=self._variables.python_relative_path) \
             or __check_file(relative_path=self._variables.activate_relative_path)
     
+    @staticmethod
+    def __get_script_class(script_name):
+        import importlib
+
+        scripts_path = str(Path(__file__).parent)
+        if scripts_path not in sys.path:
+            sys.path.append(scripts_path)
+
+        script_module = importlib.import_module(name=script_name)
+
+        for script_class in vars(script_module).values():
+            if (
+                isinstance(script_class, type) 
+                and issubclass(script_class, BaseScript)
+                and script_class.__module__ == script_module.__name__
+            ):
+                return script_class
+
+        raise Exception('Script \"{}\" not found.'.format(script_name))
+
+    async def __run_commands(self, commands, max_workers, timeout, callback):
+        import asyncio
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def __run(index, command):
+            async with semaphore:
+                try:
+                    result = await asyncio.wait_for(
+                        self.__run_async_command(command=command),
+                        timeout=command.get('timeout', timeout)
+                    )
+
+                except asyncio.TimeoutError:
+                    result = Exception('Command \"{}\" timed out after {} seconds.'.format(
+                        command['command'],
+                        command.get('timeout', timeout)
+                    ))
+
+                except Exception as exception:
+                    result = exception
+
+            if callback is not None:
+                callback(index, result)
+
+            return result
+
+        # Interrupting cancels the tasks, each killing its process on the way out.
+        return await asyncio.gather(*(__run(index, command) for index, command in enumerate(commands)))
+
+    async def __run_async_command(self, command):
+        import asyncio
+
+        process = await asyncio.create_subprocess_exec(
+            command['command'],
+            *[str(parameter) for parameter in command.get('parameters', ())],
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            limit=1024 ** 2,
+            # In its own process group, so the processes it starts e.g. `venv` or `pip` can be killed with it.
+            start_new_session=not self._is_windows
+        )
+
+        start_time = time.time()
+        output_prefix = command.get('output_prefix')
+        output_file = open(command['output_path'], mode='a') if command.get('output_path') is not None else None
+        output_lines = []
+
+        try:
+            # Reading line by line, output is never held whole unless it's returned.
+            async for line in process.stdout:
+                line = line.decode(errors='replace')
+
+                if output_prefix is not None:
+                    print('{}{}'.format(output_prefix, line.rstrip('\n')), file=sys.stdout, flush=True)
+                elif output_file is not None:
+                    output_file.write(line)
+                else:
+                    output_lines.append(line)
+
+            return_code = await process.wait()
+
+        finally:
+            if output_file is not None:
+                output_file.close()
+            if process.returncode is None:
+                if self._is_windows:
+                    process.kill()
+                else:
+                    import signal
+                    os.killpg(process.pid, signal.SIGKILL)
+                await process.wait()
+
+            # Commands run concurrently on the same thread, each is shown on its own line by its process.
+            self.__record_command_event(
+                command=command['command'],
+                parameters=command.get('parameters', ()),
+                start_time=start_time,
+                return_code=process.returncode,
+                thread_id=process.pid
+            )
+
+        if return_code != 0:
+            raise Exception('Command \"{}\" failed with exit code {}.'.format(command['command'], return_code))
+
+        return ''.join(output_lines).strip() if output_prefix is None and output_file is None else None
+
+    def __start_profile(self, profile_path):
+
+        BaseScript.__profile_pending = False
+
+        if profile_path is None:
+            BaseScript.__profile_events = []
+            return
+
+        BaseScript.__profile_path = profile_path
+
+        # Scripts run as commands write their events next to the trace, for the outermost script to merge them.
+        os.environ['SCRIPTS_PROFILE'] = profile_path
+        os.environ.setdefault('SCRIPTS_PROFILE_PARENT', str(os.getpid()))
+
+    def __record_event(self, name, start_time, end_time=None, category='phase', arguments=None, thread_id=None):
+
+        if BaseScript.__profile_path is None and not BaseScript.__profile_pending:
+            return
+
+        # Complete events of the Chrome trace format, in microseconds since the epoch so processes line up.
+        BaseScript.__profile_events.append({
+            'name': '{}: {}'.format(self.__script_name, name) if category == 'phase' else name,
+            'cat': category,
+            'ph': 'X',
+            'ts': int(start_time * 1e6),
+            'dur': int(((end_time or time.time()) - start_time) * 1e6),
+            'pid': os.getpid(),
+            'tid': thread_id or get_ident(),
+            'args': arguments or {}
+        })
+
+    def __record_command_event(self, command, parameters, start_time, return_code, thread_id=None):
+
+        self.__record_event(
+            name=' '.join([os.path.basename(command)] + [str(parameter) for parameter in parameters]),
+            start_time=start_time,
+            category='command',
+            arguments={'argv': [command] + [str(parameter) for parameter in parameters], 'exit_code': return_code},
+            thread_id=thread_id
+        )
+
+    def __write_profile(self):
+        import json
+
+        profile_path = BaseScript.__profile_path
+        events = [
+            {'name': 'process_name', 'ph': 'M', 'pid': os.getpid(), 'args': {'name': self.__script_name}}
+        ] + BaseScript.__profile_events
+
+        if os.environ.get('SCRIPTS_PROFILE_PARENT') != str(os.getpid()):
+            with open('{}.{}.part'.format(profile_path, os.getpid()), mode='w') as part_file:
+                json.dump(events, part_file)
+            return
+
+        from glob import escape, glob
+
+        for part_path in glob('{}.*.part'.format(escape(profile_path))):
+            try:
+                with open(part_path, mode='r') as part_file:
+                    events += json.load(part_file)
+                os.remove(part_path)
+            except (OSError, ValueError):
+                pass
+
+        with open(profile_path, mode='w') as profile_file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, profile_file)
+
+        # Summing the time of events with the same name, nested events are also counted in their parents.
+        totals = {}
+        for event in events:
+            if event['ph'] == 'X':
+                total = totals.setdefault(event['name'], [0, 0])
+                total[0] += event['dur']
+                total[1] += 1
+
+        print('\n{:>10}  {:>6}  {}'.format('Time', 'Calls', 'Name'), file=sys.stderr)
+        for name, (duration, count) in sorted(totals.items(), key=lambda total: -total[1][0])[:20]:
+            print(
+                '{:>8.3f} s  {:>6}  {}'.format(
+                    duration / 1e6,
+                    count,
+                    name if len(name) <= 80 else name[:77] + '...'
+                ),
+                file=sys.stderr
+            )
+        print('Trace written to \"{}\".'.format(profile_path), file=sys.stderr)
+
+    def __probe_python_metadata(self, python_path):
+        import json
+
+        output = self.run_command(
+            command=python_path,
+            parameters=(
+                '-c',
+                'import json, platform, sysconfig; '
+                'print(json.dumps(dict('
+                'version=platform.python_version(), '
+                'implementation=platform.python_implementation(), '
+                'abi=sysconfig.get_config_var(\'SOABI\') or \'\', '
+                'platform=sysconfig.get_platform()'
+                ')))'
+            )
+        )
+
+        try:
+            return json.loads(output)
+
+        except ValueError:
+            return None
+
+    def __load_python_metadata_cache(self):
+        import json
+
+        if BaseScript.__python_metadata_cache is None:
+
+            try:
+                with open(file=self._cache_path.joinpath('interpreters.json'), mode='r') as cache_file:
+                    BaseScript.__python_metadata_cache = json.load(cache_file)
+
+            except (OSError, ValueError):
+                BaseScript.__python_metadata_cache = {}
+
+        return BaseScript.__python_metadata_cache
+
+    def __save_python_metadata_cache(self):
+        import json
+
+        self.__write_cache_file(
+            file_name='interpreters.json',
+            content=json.dumps(BaseScript.__python_metadata_cache, indent=4)
+        )
+
+    def __write_cache_file(self, file_name, content):
+
+        cache_file_path = self._cache_path.joinpath(file_name)
+        temporary_file_path = cache_file_path.with_suffix('.{}.tmp'.format(os.getpid()))
+
+        try:
+            os.makedirs(self._cache_path, exist_ok=True)
+
+            with open(file=temporary_file_path, mode='wb' if isinstance(content, bytes) else 'w') as cache_file:
+                cache_file.write(content)
+
+            # Replacing atomically so concurrent scripts never read a partially written cache.
+            os.replace(temporary_file_path, cache_file_path)
+
+        except OSError:
+            pass  # The cache is an optimization, failing to write it shouldn't fail the script.
+
+    def __read_environment_python_version(self, environment_path):
+
+        try:
+            with open(file=environment_path.joinpath('pyvenv.cfg'), mode='r') as configuration_file:
+                configuration = dict(
+                    (key.strip().lower(), value.strip())
+                    for key, _, value in (line.partition('=') for line in configuration_file)
+                    if value
+                )
+
+        except OSError:
+            return None
+
+        # `venv` writes "version = 3.12.1", `virtualenv` writes "version_info = 3.12.1.final.0".
+        version_parts = configuration.get('version', configuration.get('version_info', '')).split('.')[:3]
+        if len(version_parts) != 3 or not all(version_part.isdigit() for version_part in version_parts):
+            return None
+
+        home = configuration.get('home')
+        if not home or not Path(home).is_dir():
+            return None
+
+        if self._is_windows:
+            library_path = environment_path.joinpath('Lib', 'site-packages')
+        else:
+            library_path = environment_path.joinpath(
+                'lib', 
+                'python{}.{}'.format(*version_parts[:2]), 
+                'site-packages'
+            )
+
+        # A missing library directory means the configuration doesn't match the environment's layout.
+        if not library_path.is_dir():
+            return None
+
+        return '.'.join(version_parts)
+
     @staticmethod
     def __filter_exceptions():
 
@@ -200,17 +892,35 @@ class BaseScript(ABC):
         
         variables_file_name = 'variables.xml'
 
-        variables_file = ElementTree.parse(source=Path(__file__).parent.joinpath(variables_file_name))
-        variables = Namespace(**variables_file.getroot().attrib)
+        # Loading only once per process, scripts dispatched in-process reuse the loaded variables.
+        if BaseScript.__variables is None:
 
-        if self._is_windows:
-            variables.python_relative_path = r'Scripts\python.exe'
-            variables.python_version_relative_path = r'python.exe'
-            variables.activate_relative_path = r'Scripts\activate.bat'
-        else:
-            variables.python_relative_path = r'bin/python'
-            variables.python_version_relative_path = r'bin/python3'
-            variables.activate_relative_path = r'bin/activate'
+            variables_file_path = scripts_path.joinpath(variables_file_name)
+            variables = Namespace(**self.__load_variables_file(variables_file_path=variables_file_path))
+
+            if self._is_windows:
+                variables.python_relative_path = r'Scripts\python.exe'
+                variables.python_version_relative_path = r'python.exe'
+                variables.activate_relative_path = r'Scripts\activate.bat'
+            else:
+                variables.python_relative_path = r'bin/python'
+                variables.python_version_relative_path = r'bin/python3'
+                variables.activate_relative_path = r'bin/activate'
+
+            # Environment variables override the file e.g. "SCRIPTS_PYTHON_ENVIRONMENTS_PATH" for CI jobs.
+            # Those controlling the scripts themselves, e.g. the cache or profiling, aren't variables.
+            environment_variables_prefix = 'SCRIPTS_'
+            internal_environment_variables = ['SCRIPTS_CACHE_PATH', 'SCRIPTS_PROFILE', 'SCRIPTS_PROFILE_PARENT']
+            for environment_variable, value in os.environ.items():
+                if (
+                    environment_variable.startswith(environment_variables_prefix)
+                    and environment_variable not in internal_environment_variables
+                ):
+                    setattr(variables, environment_variable[len(environment_variables_prefix):].lower(), value)
+
+            BaseScript.__variables = variables
+
+        variables = BaseScript.__variables
 
         for variable_to_check in variables_to_check:
             
@@ -225,3 +935,39 @@ class BaseScript(ABC):
                 )
 
         return variables
+
+    def __load_variables_file(self, variables_file_path):
+        import marshal
+
+        try:
+            variables_file_stat = os.stat(variables_file_path)
+
+        except FileNotFoundError:
+            return {}  # All variables may be given as environment variables instead.
+
+        variables_file_identity = (
+            str(variables_file_path), 
+            variables_file_stat.st_mtime_ns, 
+            variables_file_stat.st_size
+        )
+
+        # Parsing the XML only when the file changed since it was last compiled.
+        try:
+            with open(file=self._cache_path.joinpath('variables.marshal'), mode='rb') as cache_file:
+                cached_identity, attributes = marshal.load(cache_file)
+
+            if cached_identity == variables_file_identity:
+                return attributes
+
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+        from xml.etree import ElementTree
+        attributes = dict(ElementTree.parse(source=variables_file_path).getroot().attrib)
+
+        self.__write_cache_file(
+            file_name='variables.marshal',
+            content=marshal.dumps((variables_file_identity, attributes))
+        )
+
+        return attributes
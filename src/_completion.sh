@@ -0,0 +1,116 @@
+#!/usr/bin/env bash
+# Obtained from https://github.com/agurwicz/scripts.
+
+# Tab completion of script names, environments and Python versions, for bash and for zsh through `bashcompinit`.
+# Names are read from the index written by the Python scripts when environments change, without starting Python.
+
+_scripts_path="${BASH_SOURCE[0]:-$0}"
+[[ "$_scripts_path" == */* ]] && _scripts_path="${_scripts_path%/*}" || _scripts_path=.
+[[ "$_scripts_path" != /* ]] && _scripts_path="$PWD/$_scripts_path"
+
+_scripts_list_directories() {
+    [[ -n "$ZSH_VERSION" ]] && setopt local_options null_glob
+
+    local entry
+    _scripts_directories=()
+    [[ -z "$1" ]] && return
+
+    for entry in "$1"/*; do
+        [[ -d "$entry" && "${entry##*/}" != .* ]] && _scripts_directories+=("${entry##*/}")
+    done
+}
+
+_scripts_load_index() {
+    local index_path="${SCRIPTS_CACHE_PATH:-$_scripts_path/.cache}/completion.sh"
+    local environments_path versions_path entry digits
+
+    _scripts_environments_path= _scripts_versions_path=
+    _scripts_environments=() _scripts_versions=() _scripts_names=()
+    if [[ -f "$index_path" && ! "$_scripts_path/variables.xml" -nt "$index_path" ]]; then
+        source "$index_path"
+    fi
+
+    # Directories changed since the index was written, or overridden by another one, are listed instead.
+    environments_path="${SCRIPTS_PYTHON_ENVIRONMENTS_PATH:-$_scripts_environments_path}"
+    if [[ "$environments_path" != "$_scripts_environments_path" || "$environments_path" -nt "$index_path" ]]; then
+        _scripts_list_directories "$environments_path"
+        _scripts_environments=("${_scripts_directories[@]}")
+    fi
+
+    versions_path="${SCRIPTS_PYTHON_VERSIONS_PATH:-$_scripts_versions_path}"
+    if [[ "$versions_path" != "$_scripts_versions_path" || "$versions_path" -nt "$index_path" ]]; then
+        _scripts_list_directories "$versions_path"
+        _scripts_versions=()
+        for entry in "${_scripts_directories[@]}"; do
+            _scripts_versions+=("$entry")
+            digits="${entry#Python}"
+            [[ "$entry" == Python* && "$digits" =~ ^[0-9]+$ ]] && _scripts_versions+=("${digits:0:1}.${digits:1}")
+        done
+    fi
+
+    if [[ ${#_scripts_names[@]} -eq 0 || "$_scripts_path" -nt "$index_path" ]]; then
+        _scripts_names=()
+        for entry in "$_scripts_path"/*.py "$_scripts_path"/*.sh; do
+            entry="${entry##*/}"
+            [[ "$entry" != _* && "$entry" != scripts.py && "$entry" != \** ]] && _scripts_names+=("${entry%.*}")
+        done
+    fi
+}
+
+_scripts_complete() {
+    local script_name="${COMP_WORDS[0]##*/}" current="${COMP_WORDS[COMP_CWORD]}"
+    local previous="${COMP_WORDS[COMP_CWORD-1]}" first_index=1 position=0 index candidate
+    local candidates=()
+
+    _scripts_load_index
+
+    # The entry point takes the script name first, then the script's own arguments.
+    script_name="${script_name%.py}"
+    if [[ "$script_name" == scripts || "$script_name" == scripts.pyz ]]; then
+        if [[ $COMP_CWORD -eq 1 ]]; then
+            candidates=("${_scripts_names[@]}")
+        fi
+        script_name="${COMP_WORDS[1]%.py}"
+        first_index=2
+    fi
+
+    # Position of the word among the positional arguments, not counting options and the values of common ones.
+    for (( index = first_index; index < COMP_CWORD; index++ )); do
+        case "${COMP_WORDS[index-1]}" in
+            -e|--environment|-f|--from|-p|--packages|-l|--lockfile|-x|--export-lockfile) continue ;;
+        esac
+        [[ "${COMP_WORDS[index]}" != -* ]] && (( position += 1 ))
+    done
+
+    if [[ $COMP_CWORD -ge $first_index ]]; then
+        case "$script_name:$previous" in
+            createenv:-f|createenv:--from|*:-e|*:--environment)
+                candidates=("${_scripts_environments[@]}") ;;
+            createenv:*)
+                [[ $position -eq 1 ]] && candidates=("${_scripts_versions[@]}") ;;
+            activateenv:*|startspyder:*)
+                [[ $position -eq 0 ]] && candidates=("${_scripts_environments[@]}") ;;
+            deleteenv:*|sizeenvs:*)
+                candidates=("${_scripts_environments[@]}") ;;
+            catscript:*|openscript:*)
+                [[ $position -eq 0 ]] && candidates=("${_scripts_names[@]}") ;;
+        esac
+    fi
+
+    COMPREPLY=()
+    for candidate in "${candidates[@]}"; do
+        [[ "$candidate" == "$current"* ]] && COMPREPLY+=("$candidate")
+    done
+}
+
+if [[ -n "$ZSH_VERSION" ]]; then
+    autoload -U +X bashcompinit && bashcompinit
+fi
+
+_scripts_load_index
+for _scripts_name in "${_scripts_names[@]}"; do
+    complete -o default -F _scripts_complete "$_scripts_name" "$_scripts_name.py"
+done
+complete -o default -F _scripts_complete scripts scripts.py scripts.pyz
+
+unset _scripts_name
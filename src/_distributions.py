@@ -0,0 +1,205 @@
+# Obtained from https://github.com/agurwicz/scripts.
+
+import hashlib
+import os
+import re
+
+
+def normalize_name(name):
+    # Names are compared as in PEP 503, e.g. "Foo.Bar" and "foo_bar" are the same distribution.
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+
+def get_installed_distributions(site_packages_path):
+
+    installed_distributions = {}
+
+    try:
+        entries = list(os.scandir(site_packages_path))
+    except (OSError, TypeError):
+        return installed_distributions
+
+    # Metadata directories are named "<name>-<version>.dist-info", the name never contains a dash.
+    for entry in entries:
+        if entry.name.endswith('.dist-info') and entry.is_dir():
+            name, _, version = entry.name[:-len('.dist-info')].partition('-')
+            installed_distributions[normalize_name(name=name)] = version
+
+    return installed_distributions
+
+
+def parse_wheel_file_name(wheel_file_name):
+
+    # Wheel files are named "<name>-<version>(-<build>)?-<python>-<abi>-<platform>.whl".
+    name, version = wheel_file_name.split('-')[:2]
+
+    return normalize_name(name=name), version
+
+
+def write_lockfile(lockfile_path, installed_distributions, wheelhouse_path=''):
+
+    wheel_hashes = {}
+
+    # Hashes come from the wheels in the wheelhouse, installed files don't keep the hash of their wheel.
+    if wheelhouse_path and os.path.isdir(wheelhouse_path):
+        for wheel in os.scandir(wheelhouse_path):
+            if not wheel.name.endswith('.whl'):
+                continue
+
+            name, version = parse_wheel_file_name(wheel_file_name=wheel.name)
+            if installed_distributions.get(name) != version:
+                continue
+
+            with open(wheel.path, mode='rb') as wheel_file:
+                wheel_hashes.setdefault((name, version), []).append(hashlib.sha256(wheel_file.read()).hexdigest())
+
+    # Pip checks hashes for every requirement once any has one, so they're only written if all are known.
+    locked_distributions = sorted(installed_distributions.items())
+    with_hashes = all(distribution in wheel_hashes for distribution in locked_distributions)
+
+    with open(lockfile_path, mode='w') as lockfile:
+
+        for name, version in locked_distributions:
+
+            lockfile.write('{}=={}'.format(name, version))
+            if with_hashes:
+                for wheel_hash in sorted(wheel_hashes[(name, version)]):
+                    lockfile.write(' \\\n    --hash=sha256:{}'.format(wheel_hash))
+            lockfile.write('\n')
+
+
+def read_lockfile(lockfile_path):
+
+    with open(lockfile_path, mode='r') as lockfile:
+        content = lockfile.read().replace('\\\n', ' ')
+
+    # Only the requirements are returned, hashes are checked by pip when installing from the file.
+    return [
+        line.split('#')[0].split()[0]
+        for line in content.splitlines()
+        if line.split('#')[0].strip() and not line.strip().startswith('-')
+    ]
+
+
+# Requirements look like "name[extras]<specifiers>", anything after a ";" or "@" is left for pip to evaluate.
+requirement_pattern = re.compile(r'^([A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*(\[[^\]]*\])?\s*([^;@]*)$')
+specifier_pattern = re.compile(r'^(===|==|!=|~=|>=|<=|>|<)\s*(\S+)$')
+
+# Simplified PEP 440, local versions (after "+") are ignored when comparing.
+version_pattern = re.compile(
+    r'^v?(?:(?P<epoch>\d+)!)?(?P<release>\d+(?:\.\d+)*)'
+    r'(?:[-_.]?(?P<pre_label>a|b|c|rc|alpha|beta|pre|preview)[-_.]?(?P<pre>\d*))?'
+    r'(?:-(?P<implicit_post>\d+)|[-_.]?(?:post|rev|r)[-_.]?(?P<post>\d*))?'
+    r'(?:[-_.]?dev[-_.]?(?P<dev>\d*))?'
+    r'(?:\+[a-z0-9]+(?:[-_.][a-z0-9]+)*)?$',
+    re.IGNORECASE
+)
+pre_release_labels = {'a': 0, 'alpha': 0, 'b': 1, 'beta': 1, 'c': 2, 'rc': 2, 'pre': 2, 'preview': 2}
+
+
+def parse_requirement(requirement):
+
+    match = requirement_pattern.match(requirement.strip())
+    if match is None:
+        return None  # URLs and environment markers can't be checked here.
+
+    name, extras, specifiers = match.groups()
+
+    parsed_specifiers = []
+    for specifier in filter(None, (specifier.strip() for specifier in specifiers.split(','))):
+        specifier_match = specifier_pattern.match(specifier)
+        if specifier_match is None:
+            return None
+        parsed_specifiers.append(specifier_match.groups())
+
+    return normalize_name(name=name), extras is not None, parsed_specifiers
+
+
+def is_exact_pin(specifiers):
+    return len(specifiers) == 1 and specifiers[0][0] in ('==', '===') and not specifiers[0][1].endswith('.*')
+
+
+def satisfies(version, specifiers):
+    return all(
+        _satisfies_specifier(version=version, operator=operator, specifier_version=specifier_version)
+        for operator, specifier_version in specifiers
+    )
+
+
+def _satisfies_specifier(version, operator, specifier_version):
+
+    if operator == '===':
+        return version == specifier_version
+
+    version_key = _get_version_key(version=version)
+
+    if operator in ('==', '!=') and specifier_version.endswith('.*'):
+        matches = version_key is not None and _matches_prefix(version=version, prefix=specifier_version[:-2])
+        return matches if operator == '==' else not matches
+
+    specifier_key = _get_version_key(version=specifier_version)
+    if version_key is None or specifier_key is None:
+        return False  # Unknown formats are left for pip to resolve.
+
+    if operator == '~=':
+        # "~=1.4.5" means ">=1.4.5, ==1.4.*".
+        epoch, release = _get_release(version=specifier_version)
+        prefix = '{}!{}'.format(epoch, '.'.join(str(part) for part in release[:-1]))
+        return version_key >= specifier_key and _matches_prefix(version=version, prefix=prefix)
+
+    return {
+        '==': version_key == specifier_key,
+        '!=': version_key != specifier_key,
+        '>=': version_key >= specifier_key,
+        '<=': version_key <= specifier_key,
+        '>': version_key > specifier_key,
+        '<': version_key < specifier_key
+    }[operator]
+
+
+def _matches_prefix(version, prefix):
+
+    epoch, release = _get_release(version=version)
+    prefix_epoch, prefix_release = _get_release(version=prefix)
+
+    release = release + (0,) * max(len(prefix_release) - len(release), 0)
+
+    return epoch == prefix_epoch and release[:len(prefix_release)] == prefix_release
+
+
+def _get_release(version):
+
+    # Trailing zeros are kept, "==1.0.*" doesn't match "1.1".
+    match = version_pattern.match(version.strip())
+    if match is None:
+        return None, ()
+
+    return int(match.group('epoch') or 0), tuple(int(part) for part in match.group('release').split('.'))
+
+
+def _get_version_key(version):
+
+    match = version_pattern.match(version.strip())
+    if match is None:
+        return None
+
+    release = tuple(int(part) for part in match.group('release').split('.'))
+    while len(release) > 1 and release[-1] == 0:
+        release = release[:-1]  # "1.0" and "1" are the same version.
+
+    post = match.group('implicit_post') or match.group('post')
+    has_post = match.group('implicit_post') is not None or match.group('post') is not None
+    dev = match.group('dev')
+
+    # Development releases come before pre-releases, which come before the final release.
+    if match.group('pre_label') is not None:
+        pre_key = (1, pre_release_labels[match.group('pre_label').lower()], int(match.group('pre') or 0))
+    elif dev is not None and not has_post:
+        pre_key = (0,)
+    else:
+        pre_key = (2,)
+
+    post_key = (int(post or 0),) if has_post else (-1,)
+    dev_key = (0, int(dev or 0)) if dev is not None else (1,)
+
+    return int(match.group('epoch') or 0), release, pre_key, post_key, dev_key
@@ -0,0 +1,133 @@
+# Obtained from https://github.com/agurwicz/scripts.
+
+import os
+import shutil
+import sys
+
+# Linux's `FICLONE` ioctl, sharing the data blocks of a file on filesystems with copy-on-write (Btrfs, XFS).
+linux_reflink_request = 0x40049409
+
+
+class TreeCopier:
+
+    def __init__(self):
+
+        # Each fallback is disabled after its first failure, so unsupported filesystems don't pay for every file.
+        self.__reflinks_supported = sys.platform in ('linux', 'darwin')
+        self.__hardlinks_supported = True
+
+    def copy_tree(self, source_path, target_path):
+
+        for directory_path, directory_names, file_names in os.walk(source_path):
+
+            relative_directory_path = os.path.relpath(directory_path, source_path)
+            target_directory_path = os.path.normpath(os.path.join(target_path, relative_directory_path))
+            os.makedirs(target_directory_path, exist_ok=True)
+
+            # Symbolic links to directories are listed as directories, but are recreated instead of descended into.
+            for directory_name in list(directory_names):
+                if os.path.islink(os.path.join(directory_path, directory_name)):
+                    directory_names.remove(directory_name)
+                    file_names.append(directory_name)
+
+            for file_name in file_names:
+
+                file_path = os.path.join(directory_path, file_name)
+                target_file_path = os.path.join(target_directory_path, file_name)
+
+                if os.path.islink(file_path):
+                    os.symlink(os.readlink(file_path), target_file_path)
+
+                else:
+                    self.__link_file(file_path=file_path, target_file_path=target_file_path)
+
+    def __link_file(self, file_path, target_file_path):
+
+        if self.__reflinks_supported:
+            try:
+                self.__reflink_file(file_path=file_path, target_file_path=target_file_path)
+                return
+
+            except (OSError, AttributeError):
+                self.__reflinks_supported = False
+                if os.path.lexists(target_file_path):
+                    os.remove(target_file_path)
+
+        if self.__hardlinks_supported:
+            try:
+                os.link(file_path, target_file_path)
+                return
+
+            except OSError:
+                self.__hardlinks_supported = False
+
+        shutil.copy2(file_path, target_file_path)
+
+    @staticmethod
+    def __reflink_file(file_path, target_file_path):
+
+        if sys.platform == 'darwin':
+            import ctypes
+
+            # APFS clones through `clonefile`, which also creates the target file.
+            libc = ctypes.CDLL(None, use_errno=True)
+            if libc.clonefile(os.fsencode(file_path), os.fsencode(target_file_path), 0) != 0:
+                raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+            return
+
+        import fcntl
+
+        with open(file_path, 'rb') as source_file, open(target_file_path, 'wb') as target_file:
+            fcntl.ioctl(target_file.fileno(), linux_reflink_request, source_file.fileno())
+
+        shutil.copystat(file_path, target_file_path)
+
+
+def relocate_environment(
+    environment_path, 
+    previous_environment_path, 
+    scripts_relative_path, 
+    final_environment_path=None
+):
+
+    # The environment may still be moved to its final path, which is the one written in its files.
+    if final_environment_path is None:
+        final_environment_path = environment_path
+
+    previous_name = os.path.basename(os.path.normpath(previous_environment_path))
+    name = os.path.basename(os.path.normpath(final_environment_path))
+
+    replacements = [
+        (
+            os.fsencode(os.path.normpath(previous_environment_path)), 
+            os.fsencode(os.path.normpath(final_environment_path))
+        ),
+        # Prompts set by the activate scripts.
+        ('({}) '.format(previous_name).encode(), '({}) '.format(name).encode())
+    ]
+
+    scripts_path = os.path.join(environment_path, scripts_relative_path)
+    file_paths = [os.path.join(environment_path, 'pyvenv.cfg')] + [
+        script.path
+        for script in os.scandir(scripts_path)
+        if script.is_file(follow_symlinks=False)
+    ]
+
+    # Absolute paths are in `pyvenv.cfg`, the activate scripts and the shebangs of console scripts.
+    # Launchers on Windows keep their shebang before an appended zip, whose offsets are relative to its own start.
+    for file_path in file_paths:
+
+        with open(file_path, 'rb') as file:
+            content = file.read()
+
+        relocated_content = content
+        for previous_value, value in replacements:
+            relocated_content = relocated_content.replace(previous_value, value)
+
+        if relocated_content != content:
+            # Replacing instead of writing in place, the file may be a link shared with another environment.
+            temporary_file_path = '{}.relocating'.format(file_path)
+            with open(temporary_file_path, 'wb') as file:
+                file.write(relocated_content)
+            shutil.copymode(file_path, temporary_file_path)
+            os.replace(temporary_file_path, file_path)
@@ -0,0 +1,94 @@
+# Obtained from https://github.com/agurwicz/scripts.
+
+import hashlib
+import json
+import os
+
+pool_directory_name = '.pool'
+member_file_name = '.pool-member'
+
+
+def parse_pool_configuration(configuration):
+
+    # Entries look like "Python312=2;Python312:numpy,pandas=1", the packages being an optional profile.
+    pool_sizes = {}
+
+    for entry in filter(None, (entry.strip() for entry in configuration.split(';'))):
+
+        try:
+            key, size = entry.rsplit('=', 1)
+            python_version, _, packages = key.partition(':')
+            pool_sizes[(python_version.strip(), get_profile(packages=packages.split(',')))] = int(size)
+
+        except ValueError:
+            raise Exception('Invalid environment pool entry \"{}\".'.format(entry))
+
+    return pool_sizes
+
+
+def get_profile(packages):
+    return tuple(sorted(package.strip().lower() for package in packages if package.strip()))
+
+
+def get_members_path(environments_path, python_version, profile):
+
+    profile_name = hashlib.sha1(','.join(profile).encode()).hexdigest()[:12] if profile else 'default'
+
+    return os.path.join(environments_path, pool_directory_name, python_version, profile_name)
+
+
+def get_building_path(environments_path):
+    return os.path.join(environments_path, pool_directory_name, '.building')
+
+
+def get_interpreter_identity(python_path):
+
+    python_stat = os.stat(python_path)
+
+    return [python_stat.st_ino, python_stat.st_mtime_ns, python_stat.st_size]
+
+
+def read_member(member_path):
+
+    try:
+        with open(os.path.join(member_path, member_file_name), mode='r') as member_file:
+            return json.load(member_file)
+
+    except (OSError, ValueError):
+        return None
+
+
+def write_member(member_path, interpreter_identity):
+
+    # The path the member was built at is the one written in its files, needed to relocate it later.
+    with open(os.path.join(member_path, member_file_name), mode='w') as member_file:
+        json.dump({'interpreter': interpreter_identity, 'built_path': member_path}, member_file)
+
+
+def list_members(members_path):
+
+    try:
+        return sorted(member.path for member in os.scandir(members_path) if member.is_dir())
+    except OSError:
+        return []
+
+
+def claim_member(members_path, interpreter_identity, environment_path):
+
+    for member_path in list_members(members_path=members_path):
+
+        member = read_member(member_path=member_path)
+        if member is None or member['interpreter'] != interpreter_identity:
+            continue  # Built with a previous interpreter, refilling rebuilds it.
+
+        # Renaming is atomic, if another process claimed this member first it simply fails.
+        try:
+            os.rename(member_path, environment_path)
+
+        except OSError:
+            continue
+
+        os.remove(os.path.join(environment_path, member_file_name))
+        return member['built_path']
+
+    return None
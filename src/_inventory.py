@@ -0,0 +1,169 @@
+# Obtained from https://github.com/agurwicz/scripts.
+
+import os
+import sqlite3
+
+from _distributions import normalize_name, parse_requirement
+
+inventory_file_name = 'inventory.sqlite'
+inventory_schema = '''
+    CREATE TABLE IF NOT EXISTS environments (
+        name TEXT PRIMARY KEY,
+        site_packages_mtime INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS distributions (
+        environment TEXT NOT NULL,
+        name TEXT NOT NULL,
+        version TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        PRIMARY KEY (environment, name)
+    );
+    CREATE TABLE IF NOT EXISTS requirements (
+        environment TEXT NOT NULL,
+        distribution TEXT NOT NULL,
+        name TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS distributions_name ON distributions (name);
+    CREATE INDEX IF NOT EXISTS requirements_name ON requirements (name);
+    CREATE INDEX IF NOT EXISTS requirements_environment ON requirements (environment);
+'''
+
+
+def open_inventory(database_path):
+
+    os.makedirs(os.path.dirname(database_path), exist_ok=True)
+
+    # Scripts updating environments concurrently wait for each other's writes.
+    connection = sqlite3.connect(database_path, timeout=30)
+    connection.executescript(inventory_schema)
+
+    return connection
+
+
+def update_inventory(connection, site_packages_paths, refresh=False):
+
+    # Installing or removing a distribution adds or removes its metadata directory, changing the modification time
+    # of "site-packages", so environments whose time didn't change are skipped.
+    indexed_mtimes = dict(connection.execute('SELECT name, site_packages_mtime FROM environments'))
+
+    with connection:
+
+        for environment_name in set(indexed_mtimes) - set(site_packages_paths):
+            _remove_environment(connection=connection, environment_name=environment_name)
+
+        for environment_name, site_packages_path in site_packages_paths.items():
+
+            try:
+                site_packages_mtime = os.stat(site_packages_path).st_mtime_ns
+            except (OSError, TypeError):
+                _remove_environment(connection=connection, environment_name=environment_name)
+                continue
+
+            if not refresh and indexed_mtimes.get(environment_name) == site_packages_mtime:
+                continue
+
+            _remove_environment(connection=connection, environment_name=environment_name)
+            _index_environment(
+                connection=connection,
+                environment_name=environment_name,
+                site_packages_path=site_packages_path
+            )
+            connection.execute(
+                'INSERT INTO environments (name, site_packages_mtime) VALUES (?, ?)',
+                (environment_name, site_packages_mtime)
+            )
+
+
+def find_distributions(connection, name):
+    return connection.execute(
+        'SELECT environment, name, version, size FROM distributions WHERE name = ? ORDER BY environment',
+        (normalize_name(name=name),)
+    ).fetchall()
+
+
+def find_dependents(connection, name):
+    return connection.execute(
+        'SELECT requirements.environment, distributions.name, distributions.version, distributions.size '
+        'FROM requirements JOIN distributions ON distributions.environment = requirements.environment '
+        'AND distributions.name = requirements.distribution '
+        'WHERE requirements.name = ? ORDER BY requirements.environment, distributions.name',
+        (normalize_name(name=name),)
+    ).fetchall()
+
+
+def _remove_environment(connection, environment_name):
+    connection.execute('DELETE FROM environments WHERE name = ?', (environment_name,))
+    connection.execute('DELETE FROM distributions WHERE environment = ?', (environment_name,))
+    connection.execute('DELETE FROM requirements WHERE environment = ?', (environment_name,))
+
+
+def _index_environment(connection, environment_name, site_packages_path):
+
+    for entry in os.scandir(site_packages_path):
+
+        if not entry.name.endswith('.dist-info') or not entry.is_dir():
+            continue
+
+        name, _, version = entry.name[:-len('.dist-info')].partition('-')
+        name = normalize_name(name=name)
+
+        connection.execute(
+            'INSERT OR REPLACE INTO distributions (environment, name, version, size) VALUES (?, ?, ?, ?)',
+            (environment_name, name, version, _get_distribution_size(dist_info_path=entry.path))
+        )
+        connection.executemany(
+            'INSERT INTO requirements (environment, distribution, name) VALUES (?, ?, ?)',
+            [
+                (environment_name, name, requirement_name)
+                for requirement_name in _get_requirement_names(dist_info_path=entry.path)
+            ]
+        )
+
+
+def _get_distribution_size(dist_info_path):
+
+    # Each line of "RECORD" is "<path>,<hash>,<size>", the size being empty for some files e.g. "RECORD" itself.
+    size = 0
+
+    try:
+        with open(os.path.join(dist_info_path, 'RECORD'), mode='r', encoding='utf-8') as record_file:
+            for line in record_file:
+                file_size = line.rstrip().rsplit(',', 1)[-1]
+                if file_size.isdigit():
+                    size += int(file_size)
+
+    except OSError:
+        pass
+
+    return size
+
+
+def _get_requirement_names(dist_info_path):
+
+    requirement_names = set()
+
+    try:
+        with open(os.path.join(dist_info_path, 'METADATA'), mode='r', encoding='utf-8') as metadata_file:
+            for line in metadata_file:
+
+                # Headers end at the first empty line, the description follows.
+                if not line.strip():
+                    break
+
+                if line.startswith('Requires-Dist:'):
+                    requirement, _, marker = line[len('Requires-Dist:'):].partition(';')
+
+                    # Optional requirements, only installed with an extra, are skipped.
+                    if 'extra' in marker:
+                        continue
+
+                    # Only the name is kept, e.g. "urllib3" from "urllib3 (<3,>=1.21.1)".
+                    requirement = requirement.split('(')[0]
+                    requirement = parse_requirement(requirement=requirement.split('@')[0].replace(' ', ''))
+                    if requirement is not None:
+                        requirement_names.add(requirement[0])
+
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    return sorted(requirement_names)
@@ -0,0 +1,94 @@
+# Obtained from https://github.com/agurwicz/scripts.
+
+# Generated by `tools/buildzipapp.py`, run it again after adding, removing or renaming scripts.
+# Names of the scripts, with their class and description, so `scripts.py` imports only the one it runs.
+scripts = {
+    'catscript': (
+        'CatScript',
+        'Prints the content of script in $PATH.'
+    ),
+    'createenv': (
+        'CreateEnv',
+        'Creates Python environment.'
+    ),
+    'createlaunchjson': (
+        'CreateLaunchJson',
+        'Creates "launch.json" file for Visual Studio Code with default configuration.'
+    ),
+    'createnotebook': (
+        'CreateNotebook',
+        'Creates empty Jupyter Notebook in $PWD.'
+    ),
+    'dedupenvs': (
+        'DedupEnvs',
+        'Replaces identical files across environments with hardlinks to a content-addressed store.'
+    ),
+    'deleteenv': (
+        'DeleteEnv',
+        'Deletes Python environment.'
+    ),
+    'findpackages': (
+        'FindPackages',
+        'Finds the environments with a package installed, from an index of all environments.'
+    ),
+    'gcenvs': (
+        'GcEnvs',
+        'Lists or deletes Python environments unused for a number of days, largest first.'
+    ),
+    'installpackages': (
+        'InstallPackages',
+        'Installs and upgrades packages in Python environment.'
+    ),
+    'listenvs': (
+        'ListEnvs',
+        'Lists all Python environments.'
+    ),
+    'listpythonversions': (
+        'ListPythonVersions',
+        'Lists all Python versions available.'
+    ),
+    'listscripts': (
+        'ListScripts',
+        'Lists scripts available.'
+    ),
+    'openfile': (
+        'OpenFile',
+        'Opens file in $PATH or $HOME.'
+    ),
+    'openscript': (
+        'OpenScript',
+        'Opens script in $PATH.'
+    ),
+    'poolenvs': (
+        'PoolEnvs',
+        'Maintains the pool of pre-created environments claimed by "createenv".'
+    ),
+    'provisionenvs': (
+        'ProvisionEnvs',
+        'Creates or updates all environments in a manifest, concurrently.'
+    ),
+    'prunewheelhouse': (
+        'PruneWheelhouse',
+        'Evicts the least recently used wheels from the wheelhouse until it fits the maximum size.'
+    ),
+    'pycharmnotebook': (
+        'PycharmNotebook',
+        'Creates empty Jupyter Notebook in $PWD and opens in PyCharm.'
+    ),
+    'scriptsdaemon': (
+        'ScriptsDaemon',
+        'Runs a resident daemon that keeps scripts warm for "_scriptsclient.py".'
+    ),
+    'sizeenvs': (
+        'SizeEnvs',
+        'Lists the disk usage of Python environments, in total, unique to each and by package.'
+    ),
+    'startspyder': (
+        'StartSpyder',
+        'Starts Spyder within the given environment.'
+    ),
+    'vscodenotebook': (
+        'VscodeNotebook',
+        'Creates empty Jupyter Notebook in $PWD and opens in Visual Studio Code.'
+    )
+}
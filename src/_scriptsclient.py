@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# Obtained from https://github.com/agurwicz/scripts.
+
+# Thin client forwarding a script call to `scriptsdaemon`, falling back to running the script directly.
+# Only built-in modules are imported, so it starts in a fraction of the time `_basescript` takes.
+import marshal
+import os
+import signal
+import socket
+import struct
+import sys
+
+# Scripts reading from or handing over the terminal need its foreground process group, which the daemon isn't in.
+terminal_scripts = ['openfile']
+terminal_arguments = ['--spawn-shell', '-a', '--activate']
+
+
+def receive_integer(connection):
+
+    data = b''
+    while len(data) < 4:
+        chunk = connection.recv(4 - len(data))
+        if not chunk:
+            raise EOFError
+        data += chunk
+
+    return struct.unpack('!i', data)[0]
+
+
+def main():
+
+    if len(sys.argv) < 2:
+        print('\033[91mException:\033[0m Usage: _scriptsclient.py <script_name> [arguments ...]', file=sys.stderr)
+        sys.exit(1)
+
+    script_name, arguments = sys.argv[1], sys.argv[2:]
+    scripts_path = os.path.dirname(os.path.abspath(__file__))
+    cache_path = os.environ.get('SCRIPTS_CACHE_PATH', os.path.join(scripts_path, '.cache'))
+    socket_path = os.path.join(cache_path, 'daemon.sock')
+
+    try:
+        if script_name in terminal_scripts or any(argument in terminal_arguments for argument in arguments):
+            raise OSError
+
+        connection = socket.socket(family=socket.AF_UNIX)
+        connection.connect(socket_path)
+
+    except (OSError, AttributeError):
+        # Daemon not running (or no Unix sockets), running the script as usual.
+        script_path = os.path.join(scripts_path, '{}.py'.format(script_name))
+        os.execv(sys.executable, [sys.executable, script_path] + arguments)
+
+    payload = marshal.dumps({
+        'script_name': script_name,
+        'arguments': arguments,
+        'cwd': os.getcwd(),
+        'environment': dict(os.environ)
+    })
+
+    # The daemon's child writes directly to this process' standard streams.
+    socket.send_fds(connection, [struct.pack('!I', len(payload))], [0, 1, 2])
+    connection.sendall(payload)
+
+    try:
+        process_id = receive_integer(connection=connection)
+
+        while True:
+            try:
+                exit_code = receive_integer(connection=connection)
+                break
+
+            except KeyboardInterrupt:
+                os.kill(process_id, signal.SIGINT)
+
+    except EOFError:
+        exit_code = 1
+
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,12 +6,37 @@ if [[ "$0" == "$BASH_SOURCE" && "$1" != "-h" && "$1" != "--help" ]]; then
     exit 1
 fi
 
+# Using parameter expansion instead of `dirname`, so a cached activation doesn't fork any process.
+scripts_path="${BASH_SOURCE[0]:-$0}"
+[[ "$scripts_path" == */* ]] && scripts_path="${scripts_path%/*}" || scripts_path=.
+
 spawn_shell_argument="--spawn-shell"
-script_path="$(dirname "$(command -v "$0")")/_activateenv.py"
+script_path="$scripts_path/_activateenv.py"
 command="/usr/bin/env python3 \"$script_path\" $@"
 
-if [[ "$1" == "$spawn_shell_argument" || "$2" == "$spawn_shell_argument" ]]; then
+# Resolving the environment from the cache written by the Python scripts, without starting Python.
+cache_path="${SCRIPTS_CACHE_PATH:-$scripts_path/.cache}/activate.sh"
+_activateenv_path=
+if [[ $# -eq 1 && "$1" != -* && -f "$cache_path" ]] && [[ ! "$scripts_path/variables.xml" -nt "$cache_path" ]]; then
+    source "$cache_path"
+    _activateenv_lookup "$1"
+
+    # The cache doesn't apply when the environments path is overridden to another one.
+    if [[ -n "$SCRIPTS_PYTHON_ENVIRONMENTS_PATH" && "$SCRIPTS_PYTHON_ENVIRONMENTS_PATH" != "$_activateenv_root" ]]; then
+        _activateenv_path=
+    fi
+    unset -f _activateenv_lookup
+fi
+
+if [[ -n "$_activateenv_path" && -f "$_activateenv_path" ]]; then
+    source "$_activateenv_path"
+
+    # Recording the use for `gcenvs` without forking `touch`, truncating an empty file updates its modification time.
+    : 2>/dev/null > "${cache_path%/*}/usage/$1"
+elif [[ "$1" == "$spawn_shell_argument" || "$2" == "$spawn_shell_argument" ]]; then
     eval "$command"
 else
     eval "$(eval "$command")"
 fi
+
+unset scripts_path cache_path _activateenv_path _activateenv_root
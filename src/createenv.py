@@ -2,8 +2,13 @@
 # Obtained from https://github.com/agurwicz/scripts.
 
 import os
+from shutil import rmtree
 
 from _basescript import BaseScript
+from _environmentcopy import TreeCopier, relocate_environment
+from _environmentpool import (
+    claim_member, get_interpreter_identity, get_members_path, get_profile, parse_pool_configuration
+)
 
 
 class CreateEnv(BaseScript):
@@ -26,16 +31,36 @@ class CreateEnv(BaseScript):
 
         self._argument_parser.add_argument(
             'python_version',
-            help='python version of the environment e.g. 3.9, 3.12',
+            help='python version of the environment e.g. 3.9, 3.12 (not used with \"--from\")',
+            nargs='?',
             type=self.__existing_python_version
         )
 
+        self._argument_parser.add_argument(
+            '-f', '--from',
+            help='name of an existing environment to clone instead of installing from scratch',
+            dest='source_environment',
+            type=self.existing_environment
+        )
+
         self._argument_parser.add_argument(
             '-p', '--packages',
             help='extra packages to install in environment',
             type=lambda packages: packages.split(',')
         )
 
+        self._argument_parser.add_argument(
+            '-l', '--lockfile',
+            help='install the exact versions in a lockfile instead of packages, without resolving dependencies',
+            type=os.path.abspath
+        )
+
+        self._argument_parser.add_argument(
+            '-x', '--export-lockfile',
+            help='write the exact versions installed in the environment to a lockfile after creation',
+            type=os.path.abspath
+        )
+
         self._argument_parser.add_argument(
             '-a', '--activate',
             help='activate the environment after creation',
@@ -46,24 +71,153 @@ class CreateEnv(BaseScript):
 
     def run(self):
 
-        packages_to_install = ['pip', 'setuptools']
-        if self._arguments.packages is not None:
-            packages_to_install += self._arguments.packages
+        if (self._arguments.python_version is None) == (self._arguments.source_environment is None):
+            raise Exception('Must pass either a Python version or an environment to clone.')
+
+        if self._arguments.packages is not None and self._arguments.lockfile is not None:
+            raise Exception('Must pass either packages or a lockfile.')
+
         environment_path = os.path.join(self._variables.python_environments_path, self._arguments.environment_name)
 
-        self.run_command(
-            command=os.path.join(
-                self._variables.python_versions_path, 
-                self._arguments.python_version, 
-                self._variables.python_version_relative_path
-            ),
-            parameters=('-m', 'venv', environment_path)
-        )
+        requested_packages = self._arguments.packages if self._arguments.packages is not None else []
+
+        # Directories that aren't environments pass validation, and aren't removed if creating fails.
+        existed = os.path.exists(environment_path)
+
+        try:
+            if self._arguments.source_environment is not None:
+                self.__clone_environment(environment_path=environment_path)
+                packages_to_install = requested_packages  # The clone already has the source's packages.
+
+            else:
+                claimed_profile = self.__claim_pool_environment(environment_path=environment_path)
+
+                if claimed_profile is None:
+                    self.run_command(
+                        command=self.__get_python_path(),
+                        parameters=('-m', 'venv', environment_path),
+                        check=True
+                    )
+                    packages_to_install = ['pip', 'setuptools'] + requested_packages
+
+                elif claimed_profile == get_profile(packages=requested_packages):
+                    packages_to_install = []
+
+                else:
+                    packages_to_install = requested_packages
+
+            self.update_environment_caches()
+            self.update_inventory()
+
+            # The lockfile already has every package, including pip and setuptools.
+            if self._arguments.lockfile is not None:
+                parameters = ['--lockfile', self._arguments.lockfile]
+            elif len(packages_to_install) > 0:
+                parameters = [','.join(packages_to_install)]
+            else:
+                parameters = []
+
+            if self._arguments.export_lockfile is not None:
+                parameters += ['--export-lockfile', self._arguments.export_lockfile]
+
+            if len(parameters) > 0:
+                parameters += ['--environment', self._arguments.environment_name]
+                self.run_script(script_name='installpackages', parameters=parameters, show_output=True)
+
+        # Removing the half-built environment, so running again starts from scratch.
+        except BaseException:
+            if not existed:
+                rmtree(environment_path, ignore_errors=True)
+            self.update_environment_caches()
+            self.update_inventory()
+            raise
+
+        # Creating counts as using, also replacing the usage of an older environment with the same name.
+        self.record_environment_usage(environment_name=self._arguments.environment_name)
 
-        parameters = [','.join(packages_to_install), '--environment', self._arguments.environment_name]
         if self._arguments.activate:
-            parameters += ['--activate']
-        self.run_script(script_name='installpackages', parameters=parameters, show_output=True)
+            self.run_script(
+                script_name='_activateenv', 
+                parameters=(self._arguments.environment_name, '--spawn-shell'), 
+                show_output=True
+            )
+
+    def __get_python_path(self):
+        return os.path.join(
+            self._variables.python_versions_path, 
+            self._arguments.python_version, 
+            self._variables.python_version_relative_path
+        )
+
+    def __claim_pool_environment(self, environment_path):
+
+        if not getattr(self._variables, 'environment_pool', ''):
+            return None
+
+        pool_sizes = parse_pool_configuration(configuration=self._variables.environment_pool)
+        interpreter_identity = get_interpreter_identity(python_path=self.__get_python_path())
+
+        # Preferring a member that already has the requested packages, then a bare one.
+        for profile in dict.fromkeys([get_profile(packages=self._arguments.packages or ()), ()]):
+
+            if (self._arguments.python_version, profile) not in pool_sizes:
+                continue
+
+            built_path = claim_member(
+                members_path=get_members_path(
+                    environments_path=self._variables.python_environments_path,
+                    python_version=self._arguments.python_version,
+                    profile=profile
+                ),
+                interpreter_identity=interpreter_identity,
+                environment_path=environment_path
+            )
+
+            if built_path is not None:
+                relocate_environment(
+                    environment_path=environment_path,
+                    previous_environment_path=built_path,
+                    scripts_relative_path=os.path.dirname(self._variables.python_relative_path)
+                )
+                self.spawn_script(script_name='poolenvs', parameters='refill')
+                return profile
+
+        # Empty or stale pool, refilling it for the next environments.
+        if any(python_version == self._arguments.python_version for python_version, _ in pool_sizes):
+            self.spawn_script(script_name='poolenvs', parameters='refill')
+
+        return None
+
+    def __clone_environment(self, environment_path):
+
+        source_environment_path = os.path.join(
+            self._variables.python_environments_path, 
+            self._arguments.source_environment
+        )
+
+        # Cloning under a hidden name, so the environment only appears once it's complete.
+        temporary_environment_path = os.path.join(
+            self._variables.python_environments_path,
+            '.{}.cloning'.format(self._arguments.environment_name)
+        )
+
+        try:
+            # Files are reflinked or hardlinked when the filesystem allows, taking little time and space.
+            TreeCopier().copy_tree(source_path=source_environment_path, target_path=temporary_environment_path)
+
+            # Paths are replaced with the final ones before renaming, renaming doesn't change any content.
+            relocate_environment(
+                environment_path=temporary_environment_path,
+                previous_environment_path=source_environment_path,
+                final_environment_path=environment_path,
+                scripts_relative_path=os.path.dirname(self._variables.python_relative_path)
+            )
+
+            os.rename(temporary_environment_path, environment_path)
+
+        except BaseException:
+            rmtree(temporary_environment_path, ignore_errors=True)
+            raise
 
     def __existing_python_version(self, python_version):
         
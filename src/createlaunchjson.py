@@ -73,6 +73,8 @@ class CreateLaunchJson(BaseScript):
         with open(file=launch_file_path, mode='w') as launch_file:
             launch_file.write(launch_file_content)
 
+        self.record_environment_usage(environment_name=self._arguments.environment)
+
 
 if __name__ == '__main__':
     CreateLaunchJson()
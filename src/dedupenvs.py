@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+# Obtained from https://github.com/agurwicz/scripts.
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import stat
+import sys
+
+from _basescript import BaseScript
+
+store_directory_name = '.store'
+
+
+class DedupEnvs(BaseScript):
+
+    @property
+    def _description(self):
+        return 'Replaces identical files across environments with hardlinks to a content-addressed store.'
+
+    @property
+    def _variables_to_check(self):
+        return ['python_environments_path']
+
+    def parse_arguments(self):
+
+        self._argument_parser.add_argument(
+            '-m', '--min-size',
+            help='minimum size in bytes of the files to deduplicate',
+            default=1024,
+            type=int
+        )
+
+        self._argument_parser.add_argument(
+            '-j', '--max-workers',
+            help='maximum number of files hashed concurrently',
+            default=self._default_max_workers,
+            type=int
+        )
+
+        self._argument_parser.add_argument(
+            '-n', '--dry-run',
+            help='only print the space that would be reclaimed',
+            action='store_true'
+        )
+
+        self._argument_parser.add_argument(
+            '-v', '--verify',
+            help='check the store for files modified in place and give each of their links its own copy',
+            action='store_true'
+        )
+
+        return super().parse_arguments()
+
+    def run(self):
+
+        self.__store_path = os.path.join(self._variables.python_environments_path, store_directory_name)
+        self.__index = sqlite3.connect(str(self._cache_path.joinpath('dedup.sqlite')), timeout=30)
+
+        try:
+            self.__index.execute(
+                'CREATE TABLE IF NOT EXISTS files ('
+                'path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime INTEGER NOT NULL, hash TEXT NOT NULL)'
+            )
+            self.__index.execute('CREATE INDEX IF NOT EXISTS files_hash ON files (hash)')
+
+            if self._arguments.verify:
+                self.__verify_store()
+            else:
+                self.__deduplicate()
+
+        finally:
+            self.__index.close()
+
+    def __deduplicate(self):
+
+        files = self.__find_files()
+
+        # Files with the same size and modification time as the last run keep their hash.
+        indexed_files = {
+            path: (size, mtime, file_hash)
+            for path, size, mtime, file_hash in self.__index.execute('SELECT path, size, mtime, hash FROM files')
+        }
+
+        paths_to_hash = [
+            path
+            for path, file_stat in files.items()
+            if indexed_files.get(path, (None, None))[:2] != (file_stat.st_size, file_stat.st_mtime_ns)
+        ]
+
+        # Hashing releases the interpreter's lock, so files are read and hashed in parallel.
+        hashes = dict(zip(
+            paths_to_hash,
+            self.map_concurrently(
+                function=self.__hash_file,
+                items=paths_to_hash,
+                max_workers=self._arguments.max_workers
+            )
+        ))
+
+        paths_by_hash = {}
+        for path in files:
+
+            file_hash = hashes[path] if path in hashes else indexed_files[path][2]
+            if isinstance(file_hash, Exception):
+                continue  # Removed or unreadable since it was found.
+
+            paths_by_hash.setdefault(file_hash, []).append(path)
+
+        linked_count = 0
+        reclaimed_size = 0
+        store_file_hashes = {}
+        linked_sources = []
+
+        for file_hash, paths in paths_by_hash.items():
+
+            store_file_path = self.__get_store_file_path(file_hash=file_hash)
+            store_file_stat = self.__lstat(path=store_file_path)
+
+            # Stored files share their modification time with their links, a change means one was written in place.
+            if store_file_stat is not None:
+                if indexed_files.get(store_file_path, (None, None))[:2] != (
+                    store_file_stat.st_size, store_file_stat.st_mtime_ns
+                ):
+                    print(
+                        'Stored file {} was modified in place, run with \"--verify\".'.format(store_file_path),
+                        file=sys.stderr
+                    )
+                    continue
+                store_file_hashes[store_file_path] = file_hash
+
+            # Unique files don't enter the store, unless it already has their content from a previous run.
+            elif len(paths) < 2:
+                continue
+
+            for path in paths:
+
+                file_stat = files[path]
+
+                if store_file_stat is not None and store_file_stat.st_ino == file_stat.st_ino:
+                    continue  # Already linked.
+
+                # Files differing only in permissions e.g. executable, keep their own content.
+                if store_file_stat is not None and stat.S_IMODE(store_file_stat.st_mode) != stat.S_IMODE(
+                    file_stat.st_mode
+                ):
+                    continue
+
+                if self._arguments.dry_run:
+                    if store_file_stat is None:
+                        store_file_stat = file_stat  # The first file would become the stored one.
+                        continue
+                    linked_count += 1
+                    reclaimed_size += file_stat.st_size if file_stat.st_nlink == 1 else 0
+                    continue
+
+                if store_file_stat is None:
+                    os.makedirs(os.path.dirname(store_file_path), exist_ok=True)
+                    os.link(path, store_file_path)
+                    store_file_stat = os.lstat(store_file_path)
+                    store_file_hashes[store_file_path] = file_hash
+                    continue
+
+                # Linking under a temporary name then replacing, the file is never missing.
+                temporary_path = '{}.dedup'.format(path)
+                os.link(store_file_path, temporary_path)
+                os.replace(temporary_path, path)
+
+                if path.endswith('.py'):
+                    linked_sources.append((path, file_stat))
+
+                linked_count += 1
+                reclaimed_size += file_stat.st_size if file_stat.st_nlink == 1 else 0
+
+        if not self._arguments.dry_run:
+            reclaimed_size += self.__remove_unused_store_files()
+
+            # Rewritten bytecode has new content, so it's hashed again on the next run.
+            updated_paths = set()
+            for path, file_stat in linked_sources:
+                updated_paths.update(self.__update_bytecode(source_path=path, source_stat=file_stat))
+
+            self.__save_index(
+                file_hashes={
+                    path: hashes[path] if path in hashes else indexed_files[path][2]
+                    for path in files
+                    if path not in updated_paths
+                },
+                store_file_hashes=store_file_hashes
+            )
+
+        print(
+            '{action} {count} files, reclaiming {size:.1f} MB.'.format(
+                action='Would link' if self._arguments.dry_run else 'Linked',
+                count=linked_count,
+                size=reclaimed_size / 1024 ** 2
+            ),
+            file=sys.stdout
+        )
+
+    def __verify_store(self):
+
+        store_file_paths = [
+            os.path.join(directory_path, file_name)
+            for directory_path, _, file_names in os.walk(self.__store_path)
+            for file_name in file_names
+        ]
+
+        hashes = self.map_concurrently(
+            function=self.__hash_file,
+            items=store_file_paths,
+            max_workers=self._arguments.max_workers
+        )
+
+        modified_store_file_paths = [
+            store_file_path
+            for store_file_path, file_hash in zip(store_file_paths, hashes)
+            if not isinstance(file_hash, Exception) and file_hash != os.path.basename(store_file_path)
+        ]
+
+        # Links are found by inode, files written in place may have been indexed with their new hash.
+        paths_by_inode = {}
+        if modified_store_file_paths:
+            for (path,) in self.__index.execute('SELECT path FROM files'):
+                file_stat = self.__lstat(path=path)
+                if file_stat is not None and not path.startswith(self.__store_path + os.sep):
+                    paths_by_inode.setdefault(file_stat.st_ino, []).append(path)
+
+        unlinked_paths = []
+
+        for store_file_path in modified_store_file_paths:
+
+            # Writing to one of the links changed the content of all of them, each gets a copy of what it has now.
+            for path in paths_by_inode.get(os.lstat(store_file_path).st_ino, []):
+
+                print('Modified in place: {}'.format(path), file=sys.stdout)
+
+                temporary_path = '{}.dedup'.format(path)
+                shutil.copy2(path, temporary_path)
+                os.replace(temporary_path, path)
+                unlinked_paths.append(path)
+
+            os.remove(store_file_path)
+
+        # Copies keep the modification time, so their hash is removed from the index to be read again.
+        with self.__index:
+            self.__index.executemany(
+                'DELETE FROM files WHERE path = ?',
+                [(path,) for path in modified_store_file_paths + unlinked_paths]
+            )
+
+        print(
+            'Verified {count} stored files, {modified} modified in place.'.format(
+                count=len(store_file_paths),
+                modified=len(modified_store_file_paths)
+            ),
+            file=sys.stdout
+        )
+
+    def __find_files(self):
+
+        files = {}
+
+        for environment in os.scandir(self._variables.python_environments_path):
+
+            # Hidden directories hold the store, and environments being built or deleted.
+            if not environment.is_dir(follow_symlinks=False) or environment.name.startswith('.'):
+                continue
+
+            for directory_path, _, file_names in os.walk(environment.path):
+                for file_name in file_names:
+
+                    path = os.path.join(directory_path, file_name)
+                    file_stat = self.__lstat(path=path)
+
+                    if (
+                        file_stat is not None
+                        and stat.S_ISREG(file_stat.st_mode)
+                        and file_stat.st_size >= self._arguments.min_size
+                    ):
+                        files[path] = file_stat
+
+        return files
+
+    def __save_index(self, file_hashes, store_file_hashes):
+
+        # Stored files are indexed too, which is how files modified in place are noticed.
+        file_hashes = dict(file_hashes, **store_file_hashes)
+
+        # Linking changes the modification time of a file to the one of the stored file, so it's read again.
+        rows = []
+        for path, file_hash in file_hashes.items():
+            file_stat = self.__lstat(path=path)
+            if file_stat is not None and not isinstance(file_hash, Exception):
+                rows.append((path, file_stat.st_size, file_stat.st_mtime_ns, file_hash))
+
+        with self.__index:
+            self.__index.execute('DELETE FROM files')
+            self.__index.executemany('INSERT INTO files (path, size, mtime, hash) VALUES (?, ?, ?, ?)', rows)
+
+    def __remove_unused_store_files(self):
+
+        # Stored files with a single link are no longer in any environment, e.g. after deleting it.
+        removed_size = 0
+
+        for directory_path, _, file_names in os.walk(self.__store_path):
+            for file_name in file_names:
+
+                store_file_path = os.path.join(directory_path, file_name)
+                store_file_stat = os.lstat(store_file_path)
+
+                if store_file_stat.st_nlink == 1:
+                    os.remove(store_file_path)
+                    removed_size += store_file_stat.st_size
+
+        return removed_size
+
+    @staticmethod
+    def __update_bytecode(source_path, source_stat):
+
+        # Bytecode records its source's modification time, which linking changed to the one of the stored file.
+        # Only that time is updated, the content is the same and the environment's Python may not be this one.
+        cache_path = os.path.join(os.path.dirname(source_path), '__pycache__')
+        module_name = os.path.basename(source_path)[:-len('.py')]
+
+        old_header = (
+            (0).to_bytes(4, 'little')
+            + (int(source_stat.st_mtime) & 0xFFFFFFFF).to_bytes(4, 'little')
+            + (source_stat.st_size & 0xFFFFFFFF).to_bytes(4, 'little')
+        )
+        new_time = (int(os.lstat(source_path).st_mtime) & 0xFFFFFFFF).to_bytes(4, 'little')
+
+        try:
+            bytecode_names = os.listdir(cache_path)
+        except OSError:
+            return []
+
+        updated_paths = []
+
+        for bytecode_name in bytecode_names:
+
+            if not bytecode_name.startswith(module_name + '.') or not bytecode_name.endswith('.pyc'):
+                continue
+
+            bytecode_path = os.path.join(cache_path, bytecode_name)
+            with open(bytecode_path, mode='rb') as bytecode_file:
+                bytecode = bytecode_file.read()
+
+            # Bytecode checked by hash, or compiled from other content, is left as is.
+            if bytecode[4:16] != old_header:
+                continue
+
+            # Written under a temporary name then replacing, as the bytecode may be linked to the store too.
+            temporary_path = '{}.dedup'.format(bytecode_path)
+            with open(temporary_path, mode='wb') as bytecode_file:
+                bytecode_file.write(bytecode[:8] + new_time + bytecode[12:])
+            shutil.copymode(bytecode_path, temporary_path)
+            os.replace(temporary_path, bytecode_path)
+
+            updated_paths.append(bytecode_path)
+
+        return updated_paths
+
+    def __get_store_file_path(self, file_hash):
+        return os.path.join(self.__store_path, file_hash[:2], file_hash)
+
+    @staticmethod
+    def __hash_file(path):
+
+        file_hash = hashlib.sha256()
+
+        with open(path, mode='rb') as file:
+            for chunk in iter(lambda: file.read(1024 ** 2), b''):
+                file_hash.update(chunk)
+
+        return file_hash.hexdigest()
+
+    @staticmethod
+    def __lstat(path):
+
+        try:
+            return os.lstat(path)
+        except OSError:
+            return None
+
+
+if __name__ == '__main__':
+    DedupEnvs()
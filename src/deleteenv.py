@@ -6,6 +6,8 @@ from shutil import rmtree
 
 from _basescript import BaseScript
 
+trash_directory_name = '.trash'
+
 
 class DeleteEnv(BaseScript):
 
@@ -20,16 +22,119 @@ class DeleteEnv(BaseScript):
     def parse_arguments(self):
 
         self._argument_parser.add_argument(
-            'environment_name',
-            help='name of the environment to be deleted',
-            type=self.existing_environment
+            'environment_names',
+            help='names of the environments to be deleted, or patterns e.g. \"test-*\"',
+            nargs='*'
+        )
+
+        self._argument_parser.add_argument(
+            '-w', '--wait',
+            help='wait for the files to be removed instead of removing them in the background',
+            action='store_true'
+        )
+
+        self._argument_parser.add_argument(
+            '--empty-trash',
+            help='remove the files of previously deleted environments, done in the background after deleting',
+            action='store_true'
+        )
+
+        self._argument_parser.add_argument(
+            '-j', '--max-workers',
+            help='maximum number of directories removed concurrently',
+            default=self._default_max_workers,
+            type=int
         )
 
         return super().parse_arguments()
 
     def run(self):
-        
-        rmtree(os.path.join(self._variables.python_environments_path, self._arguments.environment_name))
+
+        trash_path = os.path.join(self._variables.python_environments_path, trash_directory_name)
+
+        if self._arguments.empty_trash:
+            for trash_entry in os.scandir(trash_path) if os.path.isdir(trash_path) else []:
+                self.__remove_tree(path=trash_entry.path)
+            return
+
+        if len(self._arguments.environment_names) == 0:
+            raise Exception('Must pass environments to delete.')
+
+        environment_names = self.__resolve_environment_names()
+        os.makedirs(trash_path, exist_ok=True)
+
+        # Renaming is atomic and immediate, the environment is gone before its files are removed.
+        trashed_paths = []
+        for environment_name in environment_names:
+            trashed_path = os.path.join(trash_path, '{}.{}'.format(environment_name, os.urandom(6).hex()))
+            os.rename(os.path.join(self._variables.python_environments_path, environment_name), trashed_path)
+            trashed_paths.append(trashed_path)
+
+        self.update_environment_caches()
+        self.update_inventory()
+
+        if self._arguments.wait:
+            for trashed_path in trashed_paths:
+                self.__remove_tree(path=trashed_path)
+
+        else:
+            self.spawn_script(script_name='deleteenv', parameters='--empty-trash')
+
+    def __resolve_environment_names(self):
+        from fnmatch import fnmatch
+
+        environment_names = []
+
+        for environment_name in self._arguments.environment_names:
+
+            if not any(character in environment_name for character in '*?['):
+                environment_names.append(self.existing_environment(environment_name=environment_name))
+                continue
+
+            matching_environment_names = sorted(
+                environment.name
+                for environment in os.scandir(self._variables.python_environments_path)
+                if environment.is_dir()
+                and not environment.name.startswith('.')
+                and fnmatch(environment.name, environment_name)
+            )
+
+            if len(matching_environment_names) == 0:
+                raise Exception('No environment matches \"{}\".'.format(environment_name))
+
+            environment_names += matching_environment_names
+
+        return list(dict.fromkeys(environment_names))
+
+    def __remove_tree(self, path):
+
+        # Splitting the tree into subtrees down to the packages in "lib/pythonX.Y/site-packages", which are removed
+        # concurrently, as removing files waits mostly on the filesystem.
+        subtree_paths = [path]
+        for _ in range(4):
+            subtree_paths = [
+                entry.path
+                for subtree_path in subtree_paths
+                for entry in self.__scan_directory(path=subtree_path)
+                if entry.is_dir(follow_symlinks=False)
+            ]
+
+        self.map_concurrently(
+            function=lambda subtree_path: rmtree(subtree_path, ignore_errors=True),
+            items=subtree_paths,
+            max_workers=self._arguments.max_workers
+        )
+
+        # Another removal may be running for the same tree, whatever is left is removed here.
+        rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def __scan_directory(path):
+
+        try:
+            return list(os.scandir(path))
+        except OSError:
+            return []
 
 
 if __name__ == '__main__':
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# Obtained from https://github.com/agurwicz/scripts.
+
+import sys
+
+from _basescript import BaseScript
+from _distributions import parse_requirement, satisfies
+from _inventory import find_dependents, find_distributions, inventory_file_name, open_inventory
+
+
+class FindPackages(BaseScript):
+
+    @property
+    def _description(self):
+        return 'Finds the environments with a package installed, from an index of all environments.'
+
+    @property
+    def _variables_to_check(self):
+        return ['python_environments_path']
+
+    def parse_arguments(self):
+
+        self._argument_parser.add_argument(
+            'requirement',
+            help='package to find, optionally with versions e.g. \"numpy<1.26\"'
+        )
+
+        self._argument_parser.add_argument(
+            '-d', '--dependents',
+            help='find the packages that require the package instead',
+            action='store_true'
+        )
+
+        self._argument_parser.add_argument(
+            '-r', '--refresh',
+            help='index all environments again instead of only the changed ones',
+            action='store_true'
+        )
+
+        return super().parse_arguments()
+
+    def run(self):
+
+        requirement = parse_requirement(requirement=self._arguments.requirement)
+        if requirement is None:
+            raise Exception('Invalid requirement \"{}\".'.format(self._arguments.requirement))
+
+        name, _, specifiers = requirement
+
+        # Only environments whose packages changed since the last query are indexed again.
+        self.update_inventory(refresh=self._arguments.refresh)
+
+        connection = open_inventory(database_path=str(self._cache_path.joinpath(inventory_file_name)))
+        try:
+            if self._arguments.dependents:
+                distributions = find_dependents(connection=connection, name=name)
+            else:
+                distributions = [
+                    distribution
+                    for distribution in find_distributions(connection=connection, name=name)
+                    if satisfies(version=distribution[2], specifiers=specifiers)
+                ]
+
+        finally:
+            connection.close()
+
+        for environment_name, distribution_name, version, size in distributions:
+            print(
+                '{environment}: {name} {version} ({size:.1f} MB)'.format(
+                    environment=environment_name,
+                    name=distribution_name,
+                    version=version,
+                    size=size / 1024 ** 2
+                ),
+                file=sys.stdout
+            )
+
+
+if __name__ == '__main__':
+    FindPackages()
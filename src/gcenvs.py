@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# Obtained from https://github.com/agurwicz/scripts.
+
+import os
+import sys
+import time
+from fnmatch import fnmatch
+
+from _basescript import BaseScript, usage_start_file_name
+
+
+class GcEnvs(BaseScript):
+
+    @property
+    def _description(self):
+        return 'Lists or deletes Python environments unused for a number of days, largest first.'
+
+    @property
+    def _variables_to_check(self):
+        return ['python_environments_path', 'python_relative_path', 'activate_relative_path']
+
+    def parse_arguments(self):
+
+        self._argument_parser.add_argument(
+            '-d', '--days',
+            help='number of days without use for an environment to be collected',
+            default=90,
+            type=int
+        )
+
+        self._argument_parser.add_argument(
+            '--delete',
+            help='delete the unused environments instead of only listing them',
+            action='store_true'
+        )
+
+        self._argument_parser.add_argument(
+            '-j', '--max-workers',
+            help='maximum number of environments measured concurrently',
+            default=self._default_max_workers,
+            type=int
+        )
+
+        return super().parse_arguments()
+
+    def run(self):
+
+        usage_path = self._cache_path.joinpath('usage')
+        environments_path = self._variables.python_environments_path
+
+        # Pinned environments, or patterns of them e.g. "prod-*", are never collected.
+        pinned_patterns = [
+            pattern.strip()
+            for pattern in getattr(self._variables, 'pinned_environments', '').split(',')
+            if pattern.strip()
+        ]
+
+        # Only directories with an interpreter or activation script are environments, as in `listenvs`.
+        environment_names = [
+            environment.name
+            for environment in os.scandir(environments_path)
+            if environment.is_dir(follow_symlinks=False)
+            and not environment.name.startswith('.')
+            and (
+                os.path.isfile(os.path.join(environment.path, self._variables.python_relative_path))
+                or os.path.isfile(os.path.join(environment.path, self._variables.activate_relative_path))
+            )
+        ]
+
+        # Without the marker no use was ever recorded, which doesn't mean environments were never used.
+        try:
+            usage_start_time = os.stat(usage_path.joinpath(usage_start_file_name)).st_mtime
+        except OSError:
+            print(
+                'Usage of environments is unknown, it\'s recorded from the next time they are activated.',
+                file=sys.stderr
+            )
+            return
+
+        now = time.time()
+        unused_environments = []
+
+        for environment_name in environment_names:
+
+            if any(fnmatch(environment_name, pattern) for pattern in pinned_patterns):
+                continue
+
+            last_used_time = self.__get_last_used_time(
+                usage_file_path=usage_path.joinpath(environment_name),
+                usage_start_time=usage_start_time
+            )
+
+            if now - last_used_time >= self._arguments.days * 24 * 60 * 60:
+                unused_environments.append((environment_name, last_used_time))
+
+        sizes = self.map_concurrently(
+            function=lambda environment: self.__get_reclaimable_size(
+                environment_path=os.path.join(environments_path, environment[0])
+            ),
+            items=unused_environments,
+            max_workers=self._arguments.max_workers
+        )
+
+        unused_environments = sorted(
+            (
+                (environment_name, last_used_time, size if not isinstance(size, Exception) else 0)
+                for (environment_name, last_used_time), size in zip(unused_environments, sizes)
+            ),
+            key=lambda environment: environment[2],
+            reverse=True
+        )
+
+        for environment_name, last_used_time, size in unused_environments:
+            print(
+                '{name}: unused for {days} days, {size:.1f} MB'.format(
+                    name=environment_name,
+                    days=int((now - last_used_time) // (24 * 60 * 60)),
+                    size=size / 1024 ** 2
+                ),
+                file=sys.stdout
+            )
+
+        print(
+            '{action} {count} environments, {size:.1f} MB.'.format(
+                action='Deleting' if self._arguments.delete else 'Found',
+                count=len(unused_environments),
+                size=sum(environment[2] for environment in unused_environments) / 1024 ** 2
+            ),
+            file=sys.stdout
+        )
+
+        if self._arguments.delete and len(unused_environments) > 0:
+            self.run_script(
+                script_name='deleteenv',
+                parameters=[environment[0] for environment in unused_environments],
+                show_output=True
+            )
+
+    @staticmethod
+    def __get_last_used_time(usage_file_path, usage_start_time):
+
+        # Environments not used since recording started count from then, not from their creation.
+        try:
+            return max(os.stat(usage_file_path).st_mtime, usage_start_time)
+        except OSError:
+            return usage_start_time
+
+    @staticmethod
+    def __get_reclaimable_size(environment_path):
+
+        # Files with other links, e.g. in clones or the store of `dedupenvs`, aren't freed by deleting.
+        size = 0
+
+        for directory_path, _, file_names in os.walk(environment_path):
+            for file_name in file_names:
+                try:
+                    file_stat = os.lstat(os.path.join(directory_path, file_name))
+                except OSError:
+                    continue
+
+                if file_stat.st_nlink == 1:
+                    size += file_stat.st_size
+
+        return size
+
+
+if __name__ == '__main__':
+    GcEnvs()
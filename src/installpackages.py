@@ -2,8 +2,13 @@
 # Obtained from https://github.com/agurwicz/scripts.
 
 import os
+import sys
 
 from _basescript import BaseScript
+from _distributions import (
+    get_installed_distributions, is_exact_pin, parse_requirement, parse_wheel_file_name, read_lockfile, satisfies, 
+    write_lockfile
+)
 
 
 class InstallPackages(BaseScript):
@@ -21,6 +26,7 @@ class InstallPackages(BaseScript):
         self._argument_parser.add_argument(
             'packages',
             help='list of packages to install and upgrade (accepts versions with \"package==version\")',
+            nargs='?',
             type=lambda packages: packages.split(',')
         )
 
@@ -30,12 +36,68 @@ class InstallPackages(BaseScript):
             type=self.existing_environment
         )
 
+        self._argument_parser.add_argument(
+            '--all-envs',
+            help='upgrade the packages in every environment that has them installed',
+            action='store_true'
+        )
+
+        self._argument_parser.add_argument(
+            '--envs',
+            help='upgrade the packages in the environments matching a pattern e.g. \"data-*\" that have them',
+            dest='environments_pattern',
+            metavar='PATTERN'
+        )
+
+        self._argument_parser.add_argument(
+            '-j', '--max-workers',
+            help='maximum number of environments upgraded concurrently with \"--all-envs\" or \"--envs\"',
+            default=4,
+            type=int
+        )
+
+        self._argument_parser.add_argument(
+            '-t', '--timeout',
+            help='maximum seconds for the upgrade of each environment with \"--all-envs\" or \"--envs\"',
+            type=float
+        )
+
         self._argument_parser.add_argument(
             '-a', '--activate',
             help='activate the environment after creation',
             action='store_true'
         )
 
+        self._argument_parser.add_argument(
+            '-o', '--offline',
+            help='install only from the wheelhouse, without accessing the network',
+            action='store_true'
+        )
+
+        self._argument_parser.add_argument(
+            '-l', '--lockfile',
+            help='install the exact versions in a lockfile instead of packages, without resolving dependencies',
+            type=os.path.abspath
+        )
+
+        self._argument_parser.add_argument(
+            '-x', '--export-lockfile',
+            help='write the exact versions installed in the environment to a lockfile after installing',
+            type=os.path.abspath
+        )
+
+        self._argument_parser.add_argument(
+            '-k', '--keep-installed',
+            help='don\'t upgrade packages that already satisfy their requirement',
+            action='store_true'
+        )
+
+        self._argument_parser.add_argument(
+            '-n', '--dry-run',
+            help='only print the packages that would be passed to pip',
+            action='store_true'
+        )
+
         return super().parse_arguments()
 
     def run(self):
@@ -43,17 +105,69 @@ class InstallPackages(BaseScript):
         if self._arguments.activate and self._arguments.environment is None:
             raise Exception('Must pass environment to activate.')
 
+        if self._arguments.packages is not None and self._arguments.lockfile is not None:
+            raise Exception('Must pass either packages or a lockfile.')
+
+        if self._arguments.all_envs or self._arguments.environments_pattern is not None:
+            self.__install_in_environments()
+            return
+
+        if self._arguments.packages is None and self._arguments.lockfile is None:
+            if self._arguments.export_lockfile is None:
+                raise Exception('Must pass packages, a lockfile or a lockfile to export.')
+            self._arguments.packages = []
+
         python_path = os.path.join(
             self._variables.python_environments_path, 
             self._arguments.environment, 
             self._variables.python_relative_path
         ) if self._arguments.environment is not None else 'python'
 
-        self.run_command(
-            command=python_path,
-            parameters=('-m', 'pip', 'install', '--upgrade', '--no-cache-dir', *self._arguments.packages),
-            show_output=True
-        )
+        wheelhouse_path = getattr(self._variables, 'wheelhouse_path', '')
+
+        if self._arguments.offline and not wheelhouse_path:
+            raise Exception('Variable \"wheelhouse_path\" must be defined to install offline.')
+
+        if self._arguments.lockfile is not None:
+            packages = self.__get_unsatisfied_packages(
+                packages=read_lockfile(lockfile_path=self._arguments.lockfile)
+            )
+
+            # Lockfiles are installed whole, keeping their hashes, and already list every dependency.
+            requirements = ['--no-deps', '--requirement', self._arguments.lockfile]
+
+        else:
+            packages = self.__get_unsatisfied_packages(packages=self._arguments.packages)
+            requirements = packages
+
+        if self._arguments.dry_run:
+            return
+
+        if len(packages) == 0:
+            if self._arguments.lockfile is not None or len(self._arguments.packages) > 0:
+                print('All requirements are already satisfied.', file=sys.stdout)
+
+        elif wheelhouse_path:
+            self.__install_with_wheelhouse(
+                python_path=python_path, 
+                wheelhouse_path=wheelhouse_path, 
+                requirements=requirements,
+                pinned=all('==' in package for package in packages)
+            )
+
+        else:
+            self.run_command(
+                command=python_path,
+                parameters=('-m', 'pip', 'install', '--upgrade', '--no-cache-dir', *requirements),
+                show_output=True,
+                check=True
+            )
+
+        if len(packages) > 0:
+            self.update_inventory()
+
+        if self._arguments.export_lockfile is not None:
+            self.__export_lockfile(wheelhouse_path=wheelhouse_path)
 
         if self._arguments.activate:
             self.run_script(
@@ -62,6 +176,243 @@ class InstallPackages(BaseScript):
                 show_output=True
             )
 
+    def __install_in_environments(self):
+        from fnmatch import fnmatch
+
+        if self._arguments.packages is None:
+            raise Exception('Must pass packages to upgrade in environments.')
+
+        if (
+            self._arguments.environment is not None or self._arguments.activate 
+            or self._arguments.lockfile is not None or self._arguments.export_lockfile is not None
+        ):
+            raise Exception('Can\'t pass an environment, a lockfile or activate when upgrading in environments.')
+
+        package_names = {}
+        for package in self._arguments.packages:
+            requirement = parse_requirement(requirement=package)
+            if requirement is None:
+                raise Exception('Requirement \"{}\" can\'t be upgraded in environments.'.format(package))
+            package_names[package] = requirement[0]
+
+        environment_names = sorted(
+            environment.name
+            for environment in os.scandir(self._variables.python_environments_path)
+            if environment.is_dir()
+            and not environment.name.startswith('.')
+            and fnmatch(environment.name, self._arguments.environments_pattern or '*')
+            and os.path.isfile(os.path.join(environment.path, self._variables.python_relative_path))
+        )
+
+        # Finding affected environments from their metadata directories, without starting their interpreters.
+        previous_distributions = {
+            environment_name: self.__get_environment_distributions(environment_name=environment_name)
+            for environment_name in environment_names
+        }
+        affected_packages = {
+            environment_name: [
+                package
+                for package in self._arguments.packages
+                if package_names[package] in previous_distributions[environment_name]
+            ]
+            for environment_name in environment_names
+        }
+        affected_environment_names = [
+            environment_name for environment_name in environment_names if affected_packages[environment_name]
+        ]
+
+        if len(affected_environment_names) == 0:
+            print('No environment has {} installed.'.format(', '.join(package_names.values())), file=sys.stdout)
+            return
+
+        name_width = max(len(environment_name) for environment_name in affected_environment_names)
+
+        results = self.run_commands(
+            commands=[
+                dict(
+                    self.get_script_command(
+                        script_name='installpackages',
+                        parameters=[
+                            ','.join(affected_packages[environment_name]), '--environment', environment_name
+                        ] + [
+                            argument
+                            for argument, enabled in (
+                                ('--offline', self._arguments.offline),
+                                ('--keep-installed', self._arguments.keep_installed),
+                                ('--dry-run', self._arguments.dry_run)
+                            )
+                            if enabled
+                        ]
+                    ),
+                    output_prefix='{} | '.format(environment_name.ljust(name_width))
+                )
+                for environment_name in affected_environment_names
+            ],
+            max_workers=self._arguments.max_workers,
+            timeout=self._arguments.timeout
+        )
+
+        rows = [('Environment', 'Package', 'Before', 'After')]
+        for environment_name, result in zip(affected_environment_names, results):
+
+            distributions = self.__get_environment_distributions(environment_name=environment_name)
+
+            for package in affected_packages[environment_name]:
+                rows.append((
+                    environment_name,
+                    package_names[package],
+                    previous_distributions[environment_name][package_names[package]],
+                    distributions.get(package_names[package], '') 
+                    + (' (failed)' if isinstance(result, Exception) else '')
+                ))
+
+        column_widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+
+        print('', file=sys.stdout)
+        for row in rows:
+            print(
+                '  '.join(value.ljust(column_width) for value, column_width in zip(row, column_widths)).rstrip(),
+                file=sys.stdout
+            )
+
+        for environment_name, result in zip(affected_environment_names, results):
+            if isinstance(result, Exception):
+                print('{}: {}'.format(environment_name, result), file=sys.stderr)
+
+        failed_count = sum(isinstance(result, Exception) for result in results)
+        if failed_count > 0:
+            raise Exception('Failed to upgrade {} environments.'.format(failed_count))
+
+    def __get_environment_distributions(self, environment_name):
+
+        return get_installed_distributions(
+            site_packages_path=self.get_site_packages_path(
+                environment_path=os.path.join(self._variables.python_environments_path, environment_name)
+            )
+        )
+
+    def __get_unsatisfied_packages(self, packages):
+
+        environment_path = self.__get_environment_path()
+        installed_distributions = get_installed_distributions(
+            site_packages_path=self.get_site_packages_path(environment_path=environment_path)
+        ) if environment_path is not None else {}
+
+        # Checking installed versions directly from the metadata directories, pip only runs for what's missing.
+        unsatisfied_packages = []
+        for package in packages:
+
+            requirement = parse_requirement(requirement=package)
+            if requirement is None:
+                status = 'not checked'  # URLs and markers are left for pip.
+
+            else:
+                name, has_extras, specifiers = requirement
+                installed_version = installed_distributions.get(name)
+
+                if installed_version is None:
+                    status = 'not installed'
+                elif not satisfies(version=installed_version, specifiers=specifiers):
+                    status = 'installed {}'.format(installed_version)
+                elif has_extras:
+                    status = 'extras not checked'
+                elif is_exact_pin(specifiers=specifiers) or self._arguments.keep_installed:
+                    status = None
+                else:
+                    status = 'installed {}, upgrading'.format(installed_version)
+
+            if status is not None:
+                unsatisfied_packages.append(package)
+
+            if self._arguments.dry_run:
+                print(
+                    '{action} {package} ({status})'.format(
+                        action='Install' if status is not None else 'Skip',
+                        package=package,
+                        status=status if status is not None else 'satisfied'
+                    ),
+                    file=sys.stdout
+                )
+
+        return unsatisfied_packages
+
+    def __get_environment_path(self):
+
+        return os.path.join(
+            self._variables.python_environments_path, 
+            self._arguments.environment
+        ) if self._arguments.environment is not None else os.environ.get('VIRTUAL_ENV')
+
+    def __export_lockfile(self, wheelhouse_path):
+
+        environment_path = self.__get_environment_path()
+        if environment_path is None:
+            raise Exception('Must pass environment or activate one to export a lockfile.')
+
+        write_lockfile(
+            lockfile_path=self._arguments.export_lockfile,
+            installed_distributions=get_installed_distributions(
+                site_packages_path=self.get_site_packages_path(environment_path=environment_path)
+            ),
+            wheelhouse_path=wheelhouse_path
+        )
+
+    def __install_with_wheelhouse(self, python_path, wheelhouse_path, requirements, pinned):
+
+        install_parameters = (
+            '-m', 'pip', 'install', '--upgrade', '--no-index', '--find-links', wheelhouse_path, *requirements
+        )
+
+        if self._arguments.offline:
+            self.run_command(command=python_path, parameters=install_parameters, show_output=True, check=True)
+            self.__mark_used_wheels(wheelhouse_path=wheelhouse_path)
+            return
+
+        # Pinned versions can't change on the index, so if the wheelhouse has them the network isn't needed.
+        if pinned:
+            try:
+                print(
+                    self.run_command(command=python_path, parameters=install_parameters, check=True), 
+                    file=sys.stdout
+                )
+                self.__mark_used_wheels(wheelhouse_path=wheelhouse_path)
+                return
+
+            except Exception:
+                pass  # Some wheels are missing, populating the wheelhouse below.
+
+        # Downloading or building every wheel into the wheelhouse, then installing only from it.
+        os.makedirs(wheelhouse_path, exist_ok=True)
+        self.run_command(
+            command=python_path,
+            parameters=(
+                '-m', 'pip', 'wheel', '--no-cache-dir', 
+                '--wheel-dir', wheelhouse_path, '--find-links', wheelhouse_path,
+                *requirements
+            ),
+            show_output=True,
+            check=True
+        )
+        self.run_command(command=python_path, parameters=install_parameters, show_output=True, check=True)
+        self.__mark_used_wheels(wheelhouse_path=wheelhouse_path)
+
+    def __mark_used_wheels(self, wheelhouse_path):
+
+        environment_path = self.__get_environment_path()
+        if environment_path is None:
+            return
+
+        installed_distributions = get_installed_distributions(
+            site_packages_path=self.get_site_packages_path(environment_path=environment_path)
+        )
+
+        # The modification time of each wheel records its last use, `prunewheelhouse` evicts the oldest first.
+        for wheel in os.scandir(wheelhouse_path):
+            if wheel.name.endswith('.whl'):
+                name, version = parse_wheel_file_name(wheel_file_name=wheel.name)
+                if installed_distributions.get(name) == version:
+                    os.utime(wheel.path)
+
 
 if __name__ == '__main__':
     InstallPackages()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # Obtained from https://github.com/agurwicz/scripts.
 
+import sys
 from pathlib import Path
 
 from _basescript import BaseScript
@@ -17,23 +18,51 @@ class ListEnvs(BaseScript):
         return ['python_environments_path', 'python_relative_path']
 
     def parse_arguments(self):
+
+        self._argument_parser.add_argument(
+            '-r', '--refresh',
+            help='probe the interpreters again instead of using cached metadata',
+            action='store_true'
+        )
+
+        self._argument_parser.add_argument(
+            '-j', '--max-workers',
+            help='maximum number of environments probed concurrently',
+            default=self._default_max_workers,
+            type=int
+        )
+
         return super().parse_arguments()
 
     def run(self):
 
-        for environment_path in Path(self._variables.python_environments_path).iterdir():
-            
-            if environment_path.is_dir() and not environment_path.name.startswith('.'):
-                
-                python_path = environment_path.joinpath(self._variables.python_relative_path)
-                if python_path.is_file():
-
-                    print(
-                        '{environment}: {version}'.format(
-                            environment=environment_path.name, 
-                            version=self.get_python_version(python_path=python_path)
-                        )
-                    )
+        environment_paths = [
+            environment_path
+            for environment_path in Path(self._variables.python_environments_path).iterdir()
+            if environment_path.is_dir() 
+            and not environment_path.name.startswith('.')
+            and environment_path.joinpath(self._variables.python_relative_path).is_file()
+        ]
+
+        versions = self.map_concurrently(
+            function=lambda environment_path: self.get_environment_python_version(
+                environment_path=environment_path,
+                refresh=self._arguments.refresh
+            ),
+            items=environment_paths,
+            max_workers=self._arguments.max_workers
+        )
+
+        for environment_path, version in zip(environment_paths, versions):
+
+            if isinstance(version, Exception):
+                print(
+                    '{environment}: {error}'.format(environment=environment_path.name, error=version), 
+                    file=sys.stderr
+                )
+                continue
+
+            print('{environment}: {version}'.format(environment=environment_path.name, version=version))
 
 
 if __name__ == '__main__':
@@ -17,20 +17,39 @@ class ListPythonVersions(BaseScript):
         return ['python_versions_path', 'python_version_relative_path']
 
     def parse_arguments(self):
+
+        self._argument_parser.add_argument(
+            '-r', '--refresh',
+            help='probe the interpreters again instead of using cached metadata',
+            action='store_true'
+        )
+
+        self._argument_parser.add_argument(
+            '-j', '--max-workers',
+            help='maximum number of interpreters probed concurrently',
+            default=self._default_max_workers,
+            type=int
+        )
+
         return super().parse_arguments()
 
     def run(self):
 
-        for version_path in Path(self._variables.python_versions_path).iterdir():
+        version_paths = list(Path(self._variables.python_versions_path).iterdir())
+
+        versions = self.map_concurrently(
+            function=lambda version_path: self.get_python_version(
+                python_path=version_path.joinpath(self._variables.python_version_relative_path),
+                refresh=self._arguments.refresh
+            ),
+            items=version_paths,
+            max_workers=self._arguments.max_workers
+        )
 
-            try:
-                version = self.get_python_version(
-                    python_path=version_path.joinpath(self._variables.python_version_relative_path)
-                )
-                if not version:
-                    raise FileNotFoundError
+        for version_path, version in zip(version_paths, versions):
 
-            except FileNotFoundError:
+            # Skipping directories without a working interpreter.
+            if isinstance(version, Exception) or not version:
                 continue
 
             print('{name} (Python {version})'.format(name=version_path.name, version=version))
@@ -3,7 +3,7 @@
 
 from pathlib import Path
 
-from _basescript import BaseScript
+from _basescript import BaseScript, archive_path
 
 
 class ListScripts(BaseScript):
@@ -21,6 +21,14 @@ class ListScripts(BaseScript):
 
     def run(self):
 
+        # Only the scripts are in a zipapp, found in its registry.
+        if archive_path is not None:
+            from _registry import scripts
+
+            for script_name in scripts:
+                print(script_name)
+            return
+
         for script_path in Path(__file__).parent.iterdir():
 
             if (
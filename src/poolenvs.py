@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# Obtained from https://github.com/agurwicz/scripts.
+
+import os
+import sys
+import time
+from shutil import rmtree
+
+from _basescript import BaseScript
+from _environmentpool import (
+    get_building_path, get_interpreter_identity, get_members_path, list_members, parse_pool_configuration,
+    pool_directory_name, read_member, write_member
+)
+
+
+class PoolEnvs(BaseScript):
+
+    @property
+    def _description(self):
+        return 'Maintains the pool of pre-created environments claimed by \"createenv\".'
+
+    @property
+    def _variables_to_check(self):
+        return ['python_environments_path', 'python_versions_path', 'environment_pool']
+
+    def parse_arguments(self):
+
+        self._argument_parser.add_argument(
+            'action',
+            help='refill the pool, show its status or delete it',
+            choices=['refill', 'status', 'clear']
+        )
+
+        return super().parse_arguments()
+
+    def run(self):
+
+        pool_path = os.path.join(self._variables.python_environments_path, pool_directory_name)
+        pool_sizes = parse_pool_configuration(configuration=self._variables.environment_pool)
+
+        if self._arguments.action == 'clear':
+            rmtree(pool_path, ignore_errors=True)
+            return
+
+        refilling = self._arguments.action == 'refill'
+        if refilling and not self.__acquire_refill_lock(pool_path=pool_path):
+            return  # Another refill is already running.
+
+        try:
+            for (python_version, profile), size in pool_sizes.items():
+
+                interpreter_identity = get_interpreter_identity(
+                    python_path=self.__get_python_path(python_version=python_version)
+                )
+                members_path = get_members_path(
+                    environments_path=self._variables.python_environments_path,
+                    python_version=python_version,
+                    profile=profile
+                )
+
+                # Members built with a previous version of the interpreter are rebuilt.
+                member_paths = list_members(members_path=members_path)
+                stale_member_paths = [
+                    member_path
+                    for member_path in member_paths
+                    if (read_member(member_path=member_path) or {}).get('interpreter') != interpreter_identity
+                ]
+
+                if not refilling:
+                    print(
+                        '{python_version} [{profile}]: {ready}/{size} ready{stale}'.format(
+                            python_version=python_version,
+                            profile=','.join(profile) or 'default',
+                            ready=len(member_paths) - len(stale_member_paths),
+                            size=size,
+                            stale=', {} stale'.format(len(stale_member_paths)) if stale_member_paths else ''
+                        ),
+                        file=sys.stdout
+                    )
+                    continue
+
+                for member_path in stale_member_paths:
+                    rmtree(member_path, ignore_errors=True)
+
+                for _ in range(size - len(member_paths) + len(stale_member_paths)):
+                    self.__build_member(
+                        python_version=python_version,
+                        profile=profile,
+                        interpreter_identity=interpreter_identity,
+                        members_path=members_path
+                    )
+
+        finally:
+            if refilling:
+                os.remove(self.__get_refill_lock_path(pool_path=pool_path))
+
+    def __build_member(self, python_version, profile, interpreter_identity, members_path):
+
+        # Building in a separate directory, members are only claimable once complete.
+        building_path = os.path.join(
+            get_building_path(environments_path=self._variables.python_environments_path),
+            os.urandom(6).hex()
+        )
+
+        try:
+            self.run_command(
+                command=self.__get_python_path(python_version=python_version),
+                parameters=('-m', 'venv', building_path),
+                check=True
+            )
+
+            self.run_script(
+                script_name='installpackages',
+                parameters=(
+                    ','.join(['pip', 'setuptools'] + list(profile)),
+                    '--environment', os.path.relpath(building_path, self._variables.python_environments_path)
+                ),
+                show_output=True
+            )
+
+            write_member(member_path=building_path, interpreter_identity=interpreter_identity)
+
+            os.makedirs(members_path, exist_ok=True)
+            os.rename(building_path, os.path.join(members_path, os.path.basename(building_path)))
+
+        except BaseException:
+            rmtree(building_path, ignore_errors=True)
+            raise
+
+    def __get_python_path(self, python_version):
+        return os.path.join(
+            self._variables.python_versions_path,
+            python_version,
+            self._variables.python_version_relative_path
+        )
+
+    def __acquire_refill_lock(self, pool_path):
+
+        lock_path = self.__get_refill_lock_path(pool_path=pool_path)
+        os.makedirs(pool_path, exist_ok=True)
+
+        # A lock older than a day was left behind by a refill that didn't finish.
+        try:
+            if time.time() - os.stat(lock_path).st_mtime > 24 * 60 * 60:
+                os.remove(lock_path)
+        except FileNotFoundError:
+            pass
+
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+
+        except FileExistsError:
+            return False
+
+    @staticmethod
+    def __get_refill_lock_path(pool_path):
+        return os.path.join(pool_path, '.refill.lock')
+
+
+if __name__ == '__main__':
+    PoolEnvs()
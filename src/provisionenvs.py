@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# Obtained from https://github.com/agurwicz/scripts.
+
+import os
+import sys
+import time
+
+from _basescript import BaseScript
+from _distributions import get_installed_distributions, parse_requirement, read_lockfile, satisfies
+
+
+class ProvisionEnvs(BaseScript):
+
+    @property
+    def _description(self):
+        return 'Creates or updates all environments in a manifest, concurrently.'
+
+    @property
+    def _variables_to_check(self):
+        return ['python_environments_path', 'python_versions_path', 'python_version_relative_path']
+
+    def parse_arguments(self):
+
+        self._argument_parser.add_argument(
+            'manifest',
+            help='JSON or TOML file whose \"environments\" have \"python\" and \"packages\" or \"lockfile\"',
+            type=os.path.abspath
+        )
+
+        self._argument_parser.add_argument(
+            'environments',
+            help='names of the environments to provision (default: all in the manifest)',
+            nargs='*'
+        )
+
+        self._argument_parser.add_argument(
+            '-j', '--max-workers',
+            help='maximum number of environments provisioned concurrently',
+            default=4,
+            type=int
+        )
+
+        self._argument_parser.add_argument(
+            '-o', '--log-directory',
+            help='directory for the log of each environment (default: \"provision\" in the cache)',
+            type=os.path.abspath
+        )
+
+        self._argument_parser.add_argument(
+            '-t', '--timeout',
+            help='maximum number of seconds to provision each environment',
+            type=float
+        )
+
+        return super().parse_arguments()
+
+    def run(self):
+
+        environments = self.__read_manifest(manifest_path=self._arguments.manifest)
+
+        for environment_name in self._arguments.environments:
+            if environment_name not in environments:
+                raise Exception('Environment \"{}\" is not in the manifest.'.format(environment_name))
+
+        environment_names = self._arguments.environments or list(environments)
+
+        log_directory = self._arguments.log_directory or str(self._cache_path.joinpath('provision'))
+        os.makedirs(log_directory, exist_ok=True)
+
+        start_time = time.perf_counter()
+        self.__finished_count = 0
+        self.__total_count = len(environment_names)
+
+        # Environments are checked here, only those needing `createenv` or `installpackages` run a command.
+        results = {}
+        commands = []
+        command_environments = []
+
+        for environment_name in environment_names:
+            try:
+                outcome, command = self.__plan_environment(
+                    environment_name=environment_name,
+                    environment=environments[environment_name],
+                    log_path=os.path.join(log_directory, '{}.log'.format(environment_name))
+                )
+            except Exception as exception:
+                outcome, command = exception, None
+
+            if command is None:
+                results[environment_name] = outcome
+                self.__report_progress(environment_name=environment_name, result=outcome, start_time=start_time)
+            else:
+                commands.append(command)
+                command_environments.append((environment_name, outcome))
+
+        def __finish(index, result):
+            environment_name, outcome = command_environments[index]
+            results[environment_name] = result if isinstance(result, Exception) else outcome
+            self.__report_progress(
+                environment_name=environment_name,
+                result=results[environment_name],
+                start_time=start_time
+            )
+
+        self.run_commands(
+            commands=commands,
+            max_workers=self._arguments.max_workers,
+            timeout=self._arguments.timeout,
+            callback=__finish
+        )
+        results = [results[environment_name] for environment_name in environment_names]
+
+        # Concurrent creations may finish in any order, the cache is written again once all are done.
+        self.update_environment_caches()
+
+        failures = [
+            (environment_name, result)
+            for environment_name, result in zip(environment_names, results)
+            if isinstance(result, Exception)
+        ]
+        outcomes = [result for result in results if not isinstance(result, Exception)]
+
+        print(
+            '\nCreated {created}, updated {updated}, {current} up to date, {failed} failed.'.format(
+                created=outcomes.count('created'),
+                updated=outcomes.count('updated'),
+                current=outcomes.count('up to date'),
+                failed=len(failures)
+            ),
+            file=sys.stdout
+        )
+
+        for environment_name, exception in failures:
+            print(
+                '  {name}: {exception} (log: {log_path})'.format(
+                    name=environment_name,
+                    exception=exception,
+                    log_path=os.path.join(log_directory, '{}.log'.format(environment_name))
+                ),
+                file=sys.stdout
+            )
+
+        if len(failures) > 0:
+            raise Exception('{} environments failed to provision.'.format(len(failures)))
+
+    def __plan_environment(self, environment_name, environment, log_path):
+
+        # Starting a new log for each run, commands append to it.
+        with open(log_path, mode='w') as log_file:
+            log_file.write('Provisioning \"{}\" with Python {}.\n'.format(environment_name, environment['python']))
+
+        environment_path = os.path.join(self._variables.python_environments_path, environment_name)
+        python_version = self.__resolve_python_version(python_version=environment['python'])
+
+        if environment['lockfile'] is not None:
+            requirements = read_lockfile(lockfile_path=environment['lockfile'])
+            create_parameters = ['--lockfile', environment['lockfile']]
+            install_parameters = ['--lockfile', environment['lockfile']]
+
+        else:
+            requirements = environment['packages']
+            create_parameters = ['--packages', ','.join(requirements)] if requirements else []
+            install_parameters = [','.join(requirements)]
+
+        if not os.path.isdir(environment_path):
+            return 'created', dict(
+                self.get_script_command(
+                    script_name='createenv',
+                    parameters=[environment_name, python_version] + create_parameters
+                ),
+                output_path=log_path
+            )
+
+        # Existing environments aren't recreated, a different Python version needs deleting the environment first.
+        environment_version = self.get_environment_python_version(environment_path=environment_path)
+        expected_version = self.get_python_version(
+            python_path=os.path.join(
+                self._variables.python_versions_path,
+                python_version,
+                self._variables.python_version_relative_path
+            )
+        )
+        if environment_version.split('.')[:2] != expected_version.split('.')[:2]:
+            raise Exception(
+                'Environment has Python {}, expected {}.'.format(environment_version, expected_version)
+            )
+
+        if self.__is_satisfied(environment_path=environment_path, requirements=requirements):
+            return 'up to date', None
+
+        return 'updated', dict(
+            self.get_script_command(
+                script_name='installpackages',
+                parameters=install_parameters + ['--environment', environment_name, '--keep-installed']
+            ),
+            output_path=log_path
+        )
+
+    def __is_satisfied(self, environment_path, requirements):
+
+        installed_distributions = get_installed_distributions(
+            site_packages_path=self.get_site_packages_path(environment_path=environment_path)
+        )
+
+        for package in requirements:
+
+            requirement = parse_requirement(requirement=package)
+            if requirement is None:
+                return False
+
+            name, has_extras, specifiers = requirement
+            installed_version = installed_distributions.get(name)
+
+            if has_extras or installed_version is None:
+                return False
+            if not satisfies(version=installed_version, specifiers=specifiers):
+                return False
+
+        return True
+
+    def __resolve_python_version(self, python_version):
+
+        # Accepting the same versions as `createenv` e.g. "3.12" or "Python312".
+        for version_name in (python_version, 'Python{}'.format(python_version.replace('.', ''))):
+            if os.path.isdir(os.path.join(self._variables.python_versions_path, version_name)):
+                return version_name
+
+        raise Exception('Python version \"{}\" not found.'.format(python_version))
+
+    def __report_progress(self, environment_name, result, start_time):
+
+        # Called from the event loop as each command finishes, so no lock is needed.
+        self.__finished_count += 1
+        print(
+            '[{finished}/{total}] {name}: {status} ({duration:.1f} s)'.format(
+                finished=self.__finished_count,
+                total=self.__total_count,
+                name=environment_name,
+                status='failed' if isinstance(result, Exception) else result,
+                duration=time.perf_counter() - start_time
+            ),
+            file=sys.stdout,
+            flush=True
+        )
+
+    @staticmethod
+    def __read_manifest(manifest_path):
+
+        if manifest_path.endswith('.toml'):
+            try:
+                import tomllib
+            except ImportError:
+                raise Exception('TOML manifests need Python 3.11 or newer, use a JSON manifest instead.')
+
+            with open(manifest_path, mode='rb') as manifest_file:
+                manifest = tomllib.load(manifest_file)
+
+        else:
+            import json
+
+            with open(manifest_path, mode='r') as manifest_file:
+                manifest = json.load(manifest_file)
+
+        environments = {}
+
+        for environment_name, environment in manifest.get('environments', {}).items():
+
+            if 'python' not in environment:
+                raise Exception('Environment \"{}\" has no Python version.'.format(environment_name))
+
+            packages = environment.get('packages', [])
+            if isinstance(packages, str):
+                packages = packages.split(',')
+
+            lockfile = environment.get('lockfile')
+            if lockfile is not None and len(packages) > 0:
+                raise Exception('Environment \"{}\" must have packages or a lockfile.'.format(environment_name))
+
+            environments[environment_name] = {
+                'python': str(environment['python']),
+                'packages': [package.strip() for package in packages if package.strip()],
+                # Lockfiles are relative to the manifest.
+                'lockfile': os.path.join(os.path.dirname(manifest_path), lockfile) if lockfile else None
+            }
+
+        return environments
+
+
+if __name__ == '__main__':
+    ProvisionEnvs()
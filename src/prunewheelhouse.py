@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# Obtained from https://github.com/agurwicz/scripts.
+
+import os
+import sys
+
+from _basescript import BaseScript
+
+
+class PruneWheelhouse(BaseScript):
+
+    @property
+    def _description(self):
+        return 'Evicts the least recently used wheels from the wheelhouse until it fits the maximum size.'
+
+    @property
+    def _variables_to_check(self):
+        return ['wheelhouse_path']
+
+    def parse_arguments(self):
+
+        self._argument_parser.add_argument(
+            '-s', '--max-size',
+            help='maximum size of the wheelhouse e.g. 500M, 10G (default: \"wheelhouse_max_size\" in variables)',
+            type=self.__parse_size
+        )
+
+        self._argument_parser.add_argument(
+            '-n', '--dry-run',
+            help='only print the wheels that would be evicted',
+            action='store_true'
+        )
+
+        return super().parse_arguments()
+
+    def run(self):
+
+        max_size = self._arguments.max_size
+        if max_size is None:
+            if not getattr(self._variables, 'wheelhouse_max_size', ''):
+                raise Exception('Must pass maximum size or define \"wheelhouse_max_size\".')
+            max_size = self.__parse_size(size=self._variables.wheelhouse_max_size)
+
+        # Installs refresh the modification time of the wheels they use, so the oldest are the least recently used.
+        wheels = sorted(
+            (
+                (wheel.path, wheel.stat())
+                for wheel in os.scandir(self._variables.wheelhouse_path)
+                if wheel.name.endswith('.whl') and wheel.is_file()
+            ),
+            key=lambda wheel: wheel[1].st_mtime
+        )
+
+        wheelhouse_size = sum(wheel_stat.st_size for _, wheel_stat in wheels)
+        evicted_size = 0
+
+        for wheel_path, wheel_stat in wheels:
+
+            if wheelhouse_size - evicted_size <= max_size:
+                break
+
+            evicted_size += wheel_stat.st_size
+            print('Evicting {}'.format(os.path.basename(wheel_path)), file=sys.stdout)
+
+            if not self._arguments.dry_run:
+                os.remove(wheel_path)
+
+        print(
+            'Freed {freed:.1f} MB, wheelhouse has {remaining:.1f} MB.'.format(
+                freed=evicted_size / 1024 ** 2,
+                remaining=(wheelhouse_size - evicted_size) / 1024 ** 2
+            ),
+            file=sys.stdout
+        )
+
+    @staticmethod
+    def __parse_size(size):
+
+        units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+        size = size.strip().upper().rstrip('B')
+
+        try:
+            if size[-1:] in units:
+                return int(float(size[:-1]) * units[size[-1]])
+            return int(size)
+
+        except ValueError:
+            raise Exception('Invalid size \"{}\".'.format(size))
+
+
+if __name__ == '__main__':
+    PruneWheelhouse()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# Obtained from https://github.com/agurwicz/scripts.
+
+# Single entry point running any script with `scripts <script_name> [arguments ...]`, and the zipapp's main module.
+# Scripts are found in the registry, so only the module of the script being run is imported.
+import sys
+from importlib import import_module
+
+from _registry import scripts
+
+
+def print_usage(file):
+
+    print('Usage: scripts <script_name> [arguments ...]\n\nScripts:', file=file)
+
+    name_width = max(len(script_name) for script_name in scripts)
+    for script_name, (_, description) in scripts.items():
+        print('  {}  {}'.format(script_name.ljust(name_width), description), file=file)
+
+
+def main():
+
+    if len(sys.argv) < 2:
+        print_usage(file=sys.stderr)
+        sys.exit(1)
+
+    script_name, arguments = sys.argv[1], sys.argv[2:]
+
+    if script_name in ('-h', '--help'):
+        print_usage(file=sys.stdout)
+        return
+
+    if script_name not in scripts:
+        print(
+            '\033[91mException:\033[0m Script \"{}\" not found, run \"scripts --help\" for the options.'.format(
+                script_name
+            ),
+            file=sys.stderr
+        )
+        sys.exit(1)
+
+    class_name, _ = scripts[script_name]
+    getattr(import_module(name=script_name), class_name)(arguments=arguments)
+
+
+if __name__ == '__main__':
+    main()
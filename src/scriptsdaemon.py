@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# Obtained from https://github.com/agurwicz/scripts.
+
+import marshal
+import os
+import signal
+import socket
+import struct
+import sys
+import time
+
+from _basescript import BaseScript, scripts_path
+from _registry import scripts
+
+
+class ScriptsDaemon(BaseScript):
+
+    @property
+    def _description(self):
+        return 'Runs a resident daemon that keeps scripts warm for \"_scriptsclient.py\".'
+
+    @property
+    def _variables_to_check(self):
+        return []
+
+    def parse_arguments(self):
+
+        self._argument_parser.add_argument(
+            'action',
+            help='action to perform on the daemon',
+            choices=['start', 'stop', 'status']
+        )
+
+        self._argument_parser.add_argument(
+            '-f', '--foreground',
+            help='serve from the current process instead of detaching',
+            action='store_true'
+        )
+
+        return super().parse_arguments()
+
+    def run(self):
+
+        if self._is_windows:
+            raise Exception('The daemon requires Unix sockets, which aren\'t available on Windows.')
+
+        self.__socket_path = self._cache_path.joinpath('daemon.sock')
+
+        if self._arguments.action == 'start':
+
+            if self.__send_control(control='status') is not None:
+                raise Exception('Daemon is already running.')
+
+            if self._arguments.foreground:
+                self.__serve()
+                return
+
+            self.spawn_script(script_name='scriptsdaemon', parameters=('start', '--foreground'))
+
+            # Waiting for the daemon to listen, so clients started right after don't fall back.
+            for _ in range(100):
+                status = self.__send_control(control='status')
+                if status is not None:
+                    print('Daemon started with pid {}.'.format(status['pid']), file=sys.stdout)
+                    return
+                time.sleep(0.05)
+
+            raise Exception('Daemon didn\'t start.')
+
+        status = self.__send_control(control=self._arguments.action)
+        if status is None:
+            raise Exception('Daemon is not running.')
+
+        if self._arguments.action == 'status':
+            print(
+                'Daemon running with pid {pid} for {uptime:.0f}s, {requests} requests served.'.format(**status),
+                file=sys.stdout
+            )
+
+    def __send_control(self, control):
+
+        try:
+            with socket.socket(family=socket.AF_UNIX) as connection:
+                connection.connect(str(self.__socket_path))
+                self.__send_message(connection=connection, message={'control': control})
+                return self.__receive_message(connection=connection)[0]
+
+        except (OSError, EOFError):
+            return None
+
+    def __serve(self):
+
+        os.makedirs(self._cache_path, exist_ok=True)
+        if self.__socket_path.exists():
+            self.__socket_path.unlink()  # Left behind by a daemon that didn't stop cleanly.
+
+        # Only the current user may connect, requests run with their permissions.
+        previous_umask = os.umask(0o077)
+        server = socket.socket(family=socket.AF_UNIX)
+        server.bind(str(self.__socket_path))
+        os.umask(previous_umask)
+        server.listen()
+
+        # Children are never waited for, they report their exit code to the client themselves.
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+        self.__warm()
+        state = self.__get_state()
+
+        start_time = time.time()
+        requests = 0
+
+        try:
+            while True:
+
+                connection, _ = server.accept()
+
+                try:
+                    message, file_descriptors = self.__receive_message(connection=connection, file_descriptors=3)
+
+                except (OSError, EOFError, ValueError):
+                    connection.close()
+                    continue
+
+                if 'control' in message:
+                    self.__send_message(
+                        connection=connection,
+                        message={'pid': os.getpid(), 'uptime': time.time() - start_time, 'requests': requests}
+                    )
+                    connection.close()
+
+                    if message['control'] == 'stop':
+                        break
+                    continue
+
+                # Loading everything again when the configuration or the environments changed.
+                if self.__get_state() != state:
+                    self.__warm()
+                    state = self.__get_state()
+
+                requests += 1
+                if os.fork() == 0:
+                    server.close()
+                    self.__run_request(connection=connection, message=message, file_descriptors=file_descriptors)
+
+                connection.close()
+                for file_descriptor in file_descriptors:
+                    os.close(file_descriptor)
+
+        finally:
+            server.close()
+            self.__socket_path.unlink(missing_ok=True)
+
+    def __get_state(self):
+
+        def __get_mtime(path):
+            try:
+                return os.stat(path).st_mtime_ns
+            except (OSError, TypeError):
+                return None
+
+        return (
+            __get_mtime(path=scripts_path.joinpath('variables.xml')),
+            __get_mtime(path=getattr(self._variables, 'python_environments_path', None)),
+            __get_mtime(path=getattr(self._variables, 'python_versions_path', None))
+        )
+
+    def __warm(self):
+
+        self.reload_variables()
+
+        # Importing every script and probing every environment and interpreter, children inherit the results.
+        for script_name in scripts:
+            if script_name != 'scriptsdaemon':
+                try:
+                    __import__(script_name)
+                except Exception:
+                    pass
+
+        for script_name in ('listenvs', 'listpythonversions'):
+            try:
+                self.run_script(script_name=script_name)
+            except (Exception, SystemExit):
+                pass  # Scripts whose variables aren't defined simply stay cold.
+
+    def __run_request(self, connection, message, file_descriptors):
+
+        exit_code = 1
+        try:
+            # The daemon is itself a running script, the requested one is profiled as if it ran on its own.
+            self.reset_profile()
+
+            # Standard streams become the client's, so output is streamed to it directly.
+            for standard_file_descriptor, file_descriptor in enumerate(file_descriptors):
+                os.dup2(file_descriptor, standard_file_descriptor)
+                os.close(file_descriptor)
+            sys.stdout.reconfigure(line_buffering=sys.stdout.isatty())
+
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+            connection.sendall(struct.pack('!i', os.getpid()))
+
+            os.chdir(message['cwd'])
+            daemon_overrides = {key: value for key, value in os.environ.items() if key.startswith('SCRIPTS_')}
+            os.environ.clear()
+            os.environ.update(message['environment'])
+            client_overrides = {key: value for key, value in os.environ.items() if key.startswith('SCRIPTS_')}
+
+            if client_overrides != daemon_overrides:
+                self.reload_variables()
+
+            script_name = message['script_name']
+            if script_name not in scripts:
+                raise Exception('Script \"{}\" not found.'.format(script_name))
+
+            self.run_script(script_name=script_name, parameters=message['arguments'], show_output=True)
+            exit_code = 0
+
+        except SystemExit as exception:
+            if isinstance(exception.code, str):
+                print(exception.code, file=sys.stderr)
+            exit_code = exception.code if isinstance(exception.code, int) else int(exception.code is not None)
+
+        except KeyboardInterrupt:
+            exit_code = 130
+
+        except BaseException:
+            sys.excepthook(*sys.exc_info())
+
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+            try:
+                connection.sendall(struct.pack('!i', exit_code))
+            except OSError:
+                pass
+
+            os._exit(exit_code)
+
+    @staticmethod
+    def __send_message(connection, message):
+
+        payload = marshal.dumps(message)
+        connection.sendall(struct.pack('!I', len(payload)) + payload)
+
+    @staticmethod
+    def __receive_message(connection, file_descriptors=0):
+
+        header, file_descriptors, _, _ = socket.recv_fds(connection, 4, file_descriptors)
+        if len(header) < 4:
+            raise EOFError
+
+        payload_size, = struct.unpack('!I', header)
+        payload = b''
+        while len(payload) < payload_size:
+            chunk = connection.recv(payload_size - len(payload))
+            if not chunk:
+                raise EOFError
+            payload += chunk
+
+        return marshal.loads(payload), file_descriptors
+
+
+if __name__ == '__main__':
+    ScriptsDaemon()
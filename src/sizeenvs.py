@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# Obtained from https://github.com/agurwicz/scripts.
+
+import marshal
+import os
+import sys
+
+from _basescript import BaseScript
+
+
+class SizeEnvs(BaseScript):
+
+    @property
+    def _description(self):
+        return 'Lists the disk usage of Python environments, in total, unique to each and by package.'
+
+    @property
+    def _variables_to_check(self):
+        return ['python_environments_path']
+
+    def parse_arguments(self):
+
+        self._argument_parser.add_argument(
+            'environments',
+            help='names of the environments to list (default: all)',
+            nargs='*'
+        )
+
+        self._argument_parser.add_argument(
+            '-s', '--sort',
+            help='column to sort by, sizes from largest',
+            choices=['total', 'unique', 'name'],
+            default='total'
+        )
+
+        self._argument_parser.add_argument(
+            '-t', '--top',
+            help='number of largest packages listed for each environment',
+            default=3,
+            type=int
+        )
+
+        self._argument_parser.add_argument(
+            '-j', '--max-workers',
+            help='maximum number of environments walked concurrently',
+            default=self._default_max_workers,
+            type=int
+        )
+
+        return super().parse_arguments()
+
+    def run(self):
+
+        cache_path = self._cache_path.joinpath('sizes.marshal')
+
+        try:
+            with open(cache_path, mode='rb') as cache_file:
+                self.__cache = marshal.load(cache_file)
+        except (OSError, EOFError, ValueError, TypeError):
+            self.__cache = {}
+
+        # All environments are walked, files are only unique to one if no other environment links to them.
+        environment_paths = sorted(
+            environment.path
+            for environment in os.scandir(self._variables.python_environments_path)
+            if environment.is_dir(follow_symlinks=False) and not environment.name.startswith('.')
+        )
+
+        self.__updated_cache = {}
+        usages = self.map_concurrently(
+            function=self.__get_environment_usage,
+            items=environment_paths,
+            max_workers=self._arguments.max_workers
+        )
+
+        self.__save_cache(cache_path=cache_path)
+
+        environment_counts = {}
+        for usage in usages:
+            if not isinstance(usage, Exception):
+                for inode in usage['files']:
+                    environment_counts[inode] = environment_counts.get(inode, 0) + 1
+
+        rows = []
+        for environment_path, usage in zip(environment_paths, usages):
+
+            name = os.path.basename(environment_path)
+            if self._arguments.environments and name not in self._arguments.environments:
+                continue
+
+            if isinstance(usage, Exception):
+                print('{}: {}'.format(name, usage), file=sys.stderr)
+                continue
+
+            rows.append((
+                name,
+                sum(usage['files'].values()),
+                sum(size for inode, size in usage['files'].items() if environment_counts[inode] == 1),
+                sorted(usage['packages'].items(), key=lambda package: -package[1])[:self._arguments.top]
+            ))
+
+        if self._arguments.sort == 'name':
+            rows.sort(key=lambda row: row[0])
+        else:
+            rows.sort(key=lambda row: row[1 if self._arguments.sort == 'total' else 2], reverse=True)
+
+        name_width = max([len(row[0]) for row in rows] + [len('Environment')])
+        row_format = '{}  {:>10}  {:>10}  {}'
+
+        print(
+            row_format.format('Environment'.ljust(name_width), 'Total', 'Unique', 'Largest packages'),
+            file=sys.stdout
+        )
+
+        for name, total_size, unique_size, packages in rows:
+            print(
+                row_format.format(
+                    name.ljust(name_width),
+                    self.__format_size(size=total_size),
+                    self.__format_size(size=unique_size),
+                    ', '.join(
+                        '{} {}'.format(package_name, self.__format_size(size=package_size))
+                        for package_name, package_size in packages
+                    )
+                ).rstrip(),
+                file=sys.stdout
+            )
+
+    def __get_environment_usage(self, environment_path):
+
+        site_packages_path = self.get_site_packages_path(environment_path=environment_path)
+
+        files = {}
+        packages = {}
+
+        self.__walk(
+            directory_path=environment_path,
+            files=files,
+            site_packages_path=str(site_packages_path) if site_packages_path is not None else None,
+            packages=packages
+        )
+
+        return {'files': files, 'packages': packages}
+
+    def __walk(self, directory_path, files, site_packages_path, packages, package_name=None):
+
+        try:
+            directory_mtime = os.stat(directory_path).st_mtime_ns
+        except OSError:
+            return
+
+        # Adding, removing or renaming entries changes the directory's modification time, so unchanged directories
+        # are taken from the cache without listing them.
+        cached_directory = self.__cache.get(directory_path)
+        if cached_directory is None or cached_directory[0] != directory_mtime:
+            cached_directory = self.__scan_directory(
+                directory_path=directory_path, 
+                directory_mtime=directory_mtime
+            )
+
+        self.__updated_cache[directory_path] = cached_directory
+        _, file_entries, subdirectory_names = cached_directory
+
+        for file_name, inode, size in file_entries:
+            files[inode] = size
+
+            # Sizes of the entries in "site-packages" are added to the package they belong to.
+            entry_package_name = package_name
+            if directory_path == site_packages_path:
+                entry_package_name = file_name.split('.')[0]
+            if entry_package_name is not None:
+                packages[entry_package_name] = packages.get(entry_package_name, 0) + size
+
+        for subdirectory_name in subdirectory_names:
+
+            subdirectory_package_name = package_name
+            if directory_path == site_packages_path:
+                if subdirectory_name.endswith(('.dist-info', '.egg-info')) or subdirectory_name == '__pycache__':
+                    subdirectory_package_name = None
+                else:
+                    subdirectory_package_name = subdirectory_name
+
+            self.__walk(
+                directory_path=os.path.join(directory_path, subdirectory_name),
+                files=files,
+                site_packages_path=site_packages_path,
+                packages=packages,
+                package_name=subdirectory_package_name
+            )
+
+    @staticmethod
+    def __scan_directory(directory_path, directory_mtime):
+
+        file_entries = []
+        subdirectory_names = []
+
+        try:
+            for entry in os.scandir(directory_path):
+
+                # Symbolic links e.g. "lib64" point inside the environment or to the interpreter, neither counts.
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectory_names.append(entry.name)
+                elif entry.is_file(follow_symlinks=False):
+                    file_entries.append((entry.name, entry.inode(), entry.stat(follow_symlinks=False).st_size))
+
+        except OSError:
+            pass
+
+        return directory_mtime, file_entries, subdirectory_names
+
+    def __save_cache(self, cache_path):
+
+        # Written whole each time, dropping directories that no longer exist.
+        try:
+            os.makedirs(cache_path.parent, exist_ok=True)
+            temporary_cache_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+            with open(temporary_cache_path, mode='wb') as cache_file:
+                marshal.dump(self.__updated_cache, cache_file)
+            os.replace(temporary_cache_path, cache_path)
+
+        except OSError:
+            pass
+
+    @staticmethod
+    def __format_size(size):
+
+        for unit in ('B', 'KB', 'MB', 'GB'):
+            if size < 1024:
+                return '{:.1f} {}'.format(size, unit) if unit != 'B' else '{} {}'.format(size, unit)
+            size /= 1024
+
+        return '{:.1f} TB'.format(size)
+
+
+if __name__ == '__main__':
+    SizeEnvs()
@@ -74,6 +74,7 @@ class StartSpyder(BaseScript):
 
         spyder_path = self._get_spyder_path()
         self._check_spyder_installed(spyder_path=spyder_path)
+        self.record_environment_usage(environment_name=self._arguments.environment_name)
         self._launch_spyder(spyder_path=spyder_path)
 
 
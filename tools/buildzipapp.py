@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# Obtained from https://github.com/agurwicz/scripts.
+
+import ast
+import os
+import py_compile
+import sys
+import tempfile
+import zipapp
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from pathlib import Path
+
+scripts_path = Path(__file__).parent.parent.joinpath('src')
+registry_path = scripts_path.joinpath('_registry.py')
+
+
+def parse_arguments():
+
+    argument_parser = ArgumentParser(
+        description='Updates the registry of scripts used by `scripts.py`, and builds the scripts into a zipapp.',
+        formatter_class=ArgumentDefaultsHelpFormatter
+    )
+
+    argument_parser.add_argument(
+        '-o', '--output',
+        help='path of the zipapp, with \"variables.xml\" next to it or variables given as environment variables',
+        default='scripts.pyz',
+        type=os.path.abspath
+    )
+
+    argument_parser.add_argument(
+        '-p', '--python',
+        help='interpreter in the zipapp\'s shebang',
+        default='/usr/bin/env python3'
+    )
+
+    argument_parser.add_argument(
+        '-r', '--registry-only',
+        help='only update the registry, without building the zipapp',
+        action='store_true'
+    )
+
+    argument_parser.add_argument(
+        '-c', '--check',
+        help='only check that the registry is up to date, failing otherwise',
+        action='store_true'
+    )
+
+    return argument_parser.parse_args()
+
+
+def find_scripts():
+
+    scripts = {}
+
+    # Reading the scripts' source instead of importing them, which would need their variables and dependencies.
+    for script_path in sorted(scripts_path.glob('*.py')):
+
+        if script_path.name.startswith('_'):
+            continue
+
+        for node in ast.parse(script_path.read_text()).body:
+
+            if not isinstance(node, ast.ClassDef) or 'BaseScript' not in [
+                base.id for base in node.bases if isinstance(base, ast.Name)
+            ]:
+                continue
+
+            descriptions = [
+                statement.body[0].value.value
+                for statement in node.body
+                if isinstance(statement, ast.FunctionDef)
+                and statement.name == '_description'
+                and isinstance(statement.body[0], ast.Return)
+                and isinstance(statement.body[0].value, ast.Constant)
+            ]
+
+            if len(descriptions) == 0:
+                raise Exception('Script \"{}\" has no constant description.'.format(script_path.stem))
+
+            scripts[script_path.stem] = (node.name, descriptions[0])
+
+    return scripts
+
+
+def get_registry(scripts):
+
+    return (
+        '# Obtained from https://github.com/agurwicz/scripts.\n'
+        '\n'
+        '# Generated by `tools/buildzipapp.py`, run it again after adding, removing or renaming scripts.\n'
+        '# Names of the scripts, with their class and description, so `scripts.py` imports only the one it runs.\n'
+        'scripts = {{\n{}\n}}\n'
+    ).format(
+        ',\n'.join(
+            '    {!r}: (\n        {!r},\n        {!r}\n    )'.format(script_name, class_name, description)
+            for script_name, (class_name, description) in scripts.items()
+        )
+    )
+
+
+def build_zipapp(output_path, python):
+
+    with tempfile.TemporaryDirectory() as staging_path:
+
+        # Bytecode is used without checking the sources, which are kept in case the interpreter's version differs.
+        for module_path in scripts_path.glob('*.py'):
+            Path(staging_path).joinpath(module_path.name).write_bytes(module_path.read_bytes())
+            py_compile.compile(
+                file=str(module_path),
+                cfile=str(Path(staging_path).joinpath(module_path.name).with_suffix('.pyc')),
+                dfile=module_path.name,
+                doraise=True,
+                invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH
+            )
+
+        Path(staging_path).joinpath('__main__.py').write_text(
+            '# Obtained from https://github.com/agurwicz/scripts.\n'
+            '\n'
+            'from scripts import main\n'
+            '\n'
+            'main()\n'
+        )
+
+        # Stored without compression, so modules are imported without decompressing them.
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        zipapp.create_archive(source=staging_path, target=output_path, interpreter=python)
+
+
+def main():
+
+    arguments = parse_arguments()
+
+    registry = get_registry(scripts=find_scripts())
+    current_registry = registry_path.read_text() if registry_path.is_file() else None
+
+    if arguments.check:
+        if registry != current_registry:
+            print('Registry is out of date, run \"tools/buildzipapp.py --registry-only\".', file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if registry != current_registry:
+        registry_path.write_text(registry)
+        print('Updated \"{}\".'.format(registry_path))
+
+    if arguments.registry_only:
+        return
+
+    build_zipapp(output_path=arguments.output, python=arguments.python)
+    print('Built \"{}\".'.format(arguments.output))
+
+
+if __name__ == '__main__':
+    main()